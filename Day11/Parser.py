@@ -1,4 +1,8 @@
-from typing import TextIO, Any
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import TextIO
 
 from common.FileReader import ParserStrategy
 
@@ -6,12 +10,92 @@ from common.FileReader import ParserStrategy
 class ServerConnectionParser(ParserStrategy):
 
     def _parse(self, file: TextIO) -> dict[str, tuple[str]]:
-        connection_map = {}
+        return dict(self._iter_parse(file))
 
+    def _iter_parse(self, file: TextIO) -> Iterator[tuple[str, tuple[str]]]:
         for raw_line in file:
-            line = raw_line.strip()
-            server, targets = line.split(":")
-            targets = targets.strip().split(" ")
-            connection_map[server] = tuple(targets)
+            yield ServerConnectionParser._parse_line(raw_line.strip())
+
+    @staticmethod
+    def _parse_line(line: str) -> tuple[str, tuple[str]]:
+        server, targets = line.split(":")
+        targets = targets.strip().split(" ")
+        return server, tuple(targets)
+
+
+class InternedServerConnectionParser(ServerConnectionParser):
+
+    def _parse(self, file: TextIO) -> ServerGraph:
+        return ServerGraph.from_pairs(self._iter_parse(file))
+
+
+class ServerGraph:
+    """Connection map with servers interned to dense int ids.
+
+    Adjacency is stored in CSR form: the ids server ``i`` connects to are
+    ``targets[offsets[i] : offsets[i + 1]]``.
+    """
+
+    __slots__ = ("names", "ids", "offsets", "targets")
+
+    def __init__(self, names: list[str], offsets: array, targets: array) -> None:
+        self.names = names
+        self.ids = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def successors(self, server: int) -> array:
+        return self.targets[self.offsets[server] : self.offsets[server + 1]]
+
+    @classmethod
+    def from_connection_map(cls, conns: dict[str, tuple[str]]) -> ServerGraph:
+        return cls.from_pairs(conns.items())
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[str, Iterable[str]]]) -> ServerGraph:
+        """Build the graph from ``(server, targets)`` pairs in one pass.
+
+        Targets are appended in input order and then bucketed by source id. A
+        server listed on several lines keeps only its last line, the same as the
+        dict built by ``ServerConnectionParser``.
+        """
+        ids: dict[str, int] = {}
+        sources = array("i")
+        run_ends = array("i")
+        targets = array("i")
+
+        for server, conn_targets in pairs:
+            sources.append(ids.setdefault(server, len(ids)))
+            for sev in conn_targets:
+                targets.append(ids.setdefault(sev, len(ids)))
+            run_ends.append(len(targets))
+
+        last_run = {source: run for run, source in enumerate(sources)}
+
+        n = len(ids)
+        offsets = array("i", bytes(4 * (n + 1)))
+        run_start = 0
+        for run, (source, run_end) in enumerate(zip(sources, run_ends)):
+            if last_run[source] == run:
+                offsets[source + 1] += run_end - run_start
+            run_start = run_end
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        fill = offsets[:-1]
+        csr_targets = array("i", bytes(4 * offsets[n]))
+        run_start = 0
+        for run, (source, run_end) in enumerate(zip(sources, run_ends)):
+            if last_run[source] != run:
+                run_start = run_end
+                continue
+            pos = fill[source]
+            count = run_end - run_start
+            csr_targets[pos : pos + count] = targets[run_start:run_end]
+            fill[source] = pos + count
+            run_start = run_end
 
-        return connection_map
+        return cls(list(ids), offsets, csr_targets)
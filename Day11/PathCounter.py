@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections import deque
+from math import exp, inf, log
+
+from Day11.Parser import ServerGraph
+
+
+class PathCounter:
+    """Counts paths through the server connection DAG in O(V + E).
+
+    The graph is topologically sorted once with Kahn's algorithm and every
+    count is a single pass over that order, so deep server chains never touch
+    the recursion limit. Counting runs on the interned ``ServerGraph``; a plain
+    connection map is interned on construction.
+
+    Counts are exact Python ints by default. Since they grow exponentially with
+    the depth of dense graphs, ``modulus`` keeps them reduced modulo a number
+    and ``log_counts`` keeps natural logarithms as floats instead, so the
+    arithmetic stays fixed width.
+    """
+
+    def __init__(
+        self,
+        conns: dict[str, tuple[str]] | ServerGraph,
+        modulus: int | None = None,
+        log_counts: bool = False,
+    ) -> None:
+        if modulus is not None and log_counts:
+            raise ValueError("modulus and log_counts are mutually exclusive")
+        if modulus is not None and modulus < 1:
+            raise ValueError(f"modulus must be positive, got {modulus}")
+
+        if isinstance(conns, dict):
+            conns = ServerGraph.from_connection_map(conns)
+        self.graph = conns
+        self.order = PathCounter._topological_order(conns)
+        self.modulus = modulus
+        self.log_counts = log_counts
+        self._zero = -inf if log_counts else 0
+        self._one = 0.0 if log_counts else 1
+
+    def count_paths(self, start: str, target: str) -> int | float:
+        ids = self.graph.ids
+        if start not in ids or target not in ids:
+            return self._zero
+        return self.paths_to(ids[target])[ids[start]]
+
+    def paths_to(self, target: int) -> list[int] | list[float]:
+        """Number of paths from every server id to the ``target`` id."""
+        offsets, targets = self.graph.offsets, self.graph.targets
+        modulus, log_counts = self.modulus, self.log_counts
+        ways = [self._zero] * len(self.graph)
+        ways[target] = self._one
+
+        for server in reversed(self.order):
+            if server == target:
+                continue
+            edges = range(offsets[server], offsets[server + 1])
+            if log_counts:
+                ways[server] = _log_sum([ways[targets[k]] for k in edges])
+                continue
+            total = 0
+            for k in edges:
+                total += ways[targets[k]]
+            ways[server] = total % modulus if modulus else total
+
+        return ways
+
+    def waypoint_counts(
+        self, start: str, target: str, waypoints: list[str]
+    ) -> list[int] | list[float]:
+        """Count ``start`` -> ``target`` paths by the waypoints they visit.
+
+        Entry ``mask`` of the result is the number of paths whose visited
+        waypoint set is exactly ``mask``, bit ``i`` standing for
+        ``waypoints[i]``. All ``2**k`` subsets come out of one forward pass
+        that keeps a ``2**k`` slice per server in a single flat list.
+        """
+        size = 1 << len(waypoints)
+        ids = self.graph.ids
+        zero, modulus, log_counts = self._zero, self.modulus, self.log_counts
+        if start not in ids or target not in ids:
+            return [zero] * size
+
+        bits = [0] * len(self.graph)
+        for i, name in enumerate(waypoints):
+            if name in ids:
+                bits[ids[name]] |= 1 << i
+
+        offsets, targets = self.graph.offsets, self.graph.targets
+        start_id, target_id = ids[start], ids[target]
+        counts = [zero] * (len(self.graph) * size)
+        counts[start_id * size + bits[start_id]] = self._one
+
+        for server in self.order:
+            if server == target_id:
+                continue
+            base = server * size
+            reached = counts[base : base + size]
+            if modulus:
+                reached = [count % modulus for count in reached]
+            reached = [
+                (mask, count) for mask, count in enumerate(reached) if count != zero
+            ]
+            if not reached:
+                continue
+            for k in range(offsets[server], offsets[server + 1]):
+                sev = targets[k]
+                sev_base = sev * size
+                sev_bits = bits[sev]
+                for mask, count in reached:
+                    idx = sev_base + (mask | sev_bits)
+                    if log_counts:
+                        counts[idx] = _log_sum([counts[idx], count])
+                    else:
+                        counts[idx] += count
+
+        result = counts[target_id * size : (target_id + 1) * size]
+        if modulus:
+            result = [count % modulus for count in result]
+        return result
+
+    def count_visiting(
+        self, counts: list[int] | list[float], required: int
+    ) -> int | float:
+        """Paths from ``waypoint_counts`` that visit at least the ``required`` mask."""
+        covering = [
+            count for mask, count in enumerate(counts) if mask & required == required
+        ]
+        if self.log_counts:
+            return _log_sum(covering)
+        total = sum(covering)
+        return total % self.modulus if self.modulus else total
+
+    @staticmethod
+    def _topological_order(graph: ServerGraph) -> array:
+        offsets, targets = graph.offsets, graph.targets
+        indegree = array("i", bytes(4 * len(graph)))
+        for sev in targets:
+            indegree[sev] += 1
+
+        queue = deque(server for server, degree in enumerate(indegree) if degree == 0)
+        order = array("i")
+
+        while queue:
+            server = queue.popleft()
+            order.append(server)
+            for k in range(offsets[server], offsets[server + 1]):
+                sev = targets[k]
+                indegree[sev] -= 1
+                if indegree[sev] == 0:
+                    queue.append(sev)
+
+        if len(order) < len(graph):
+            remaining = {server for server, degree in enumerate(indegree) if degree > 0}
+            cycle = [graph.names[s] for s in PathCounter._find_cycle(graph, remaining)]
+            raise ValueError(f"Connections contain a cycle: {' -> '.join(cycle)}")
+
+        return order
+
+    @staticmethod
+    def _find_cycle(graph: ServerGraph, remaining: set[int]) -> list[int]:
+        # Every server Kahn could not release still has a predecessor in
+        # ``remaining``, so walking predecessors must eventually repeat.
+        preds = {}
+        for server in remaining:
+            for sev in graph.successors(server):
+                if sev in remaining:
+                    preds.setdefault(sev, server)
+
+        server = next(iter(remaining))
+        seen = {}
+        walk = []
+        while server not in seen:
+            seen[server] = len(walk)
+            walk.append(server)
+            server = preds[server]
+
+        cycle = walk[seen[server] :][::-1]
+        return cycle + [cycle[0]]
+
+
+class IncrementalPathCounter:
+    """Keeps path counts to one target up to date while connections change.
+
+    Every server stores its paths to ``target`` split by the waypoint subset
+    they visit (one slot when there are no waypoints). ``add_edge`` and
+    ``remove_edge`` repair the topological order locally (Pearce-Kelly) and
+    recompute only the ancestors whose counts actually change, nearest to the
+    target first, so an update costs time proportional to that subgraph.
+    """
+
+    def __init__(
+        self,
+        conns: dict[str, tuple[str]] | ServerGraph,
+        target: str,
+        waypoints: list[str] = (),
+    ) -> None:
+        counter = PathCounter(conns)
+        graph = counter.graph
+        self.names = list(graph.names)
+        self.ids = dict(graph.ids)
+        self.waypoints = list(waypoints)
+        self._size = 1 << len(self.waypoints)
+        self.succs = [list(graph.successors(i)) for i in range(len(graph))]
+        self.preds: list[list[int]] = [[] for _ in range(len(graph))]
+        for server, sevs in enumerate(self.succs):
+            for sev in sevs:
+                self.preds[sev].append(server)
+
+        self._pos = [0] * len(graph)
+        for pos, server in enumerate(counter.order):
+            self._pos[server] = pos
+        self._first_pos, self._last_pos = 0, len(graph) - 1
+        self._bits = [0] * len(graph)
+        self._ways = [[0] * self._size for _ in range(len(graph))]
+
+        self.target = self._intern(target, front=False)
+        for i, name in enumerate(self.waypoints):
+            self._bits[self._intern(name, front=False)] |= 1 << i
+
+        for server in sorted(range(len(self.names)), key=self._pos.__getitem__)[::-1]:
+            self._ways[server] = self._compute(server)
+
+    def counts(self, start: str) -> list[int]:
+        """Paths from ``start`` to the target, indexed by exact waypoint mask."""
+        if start not in self.ids:
+            return [0] * self._size
+        return list(self._ways[self.ids[start]])
+
+    def count(self, start: str, required: int | None = None) -> int:
+        """Paths from ``start`` that visit at least ``required`` (default: all)."""
+        if required is None:
+            required = self._size - 1
+        return sum(
+            count
+            for mask, count in enumerate(self.counts(start))
+            if mask & required == required
+        )
+
+    def add_edge(self, server: str, target: str) -> None:
+        u = self._intern(server, front=True)
+        v = self._intern(target, front=False)
+        if u == v:
+            raise ValueError(f"Connection {server} -> {target} would create a cycle")
+        if self._pos[u] > self._pos[v]:
+            self._reorder(u, v)
+        self.succs[u].append(v)
+        self.preds[v].append(u)
+        self._propagate(u)
+
+    def remove_edge(self, server: str, target: str) -> None:
+        u, v = self.ids.get(server), self.ids.get(target)
+        if u is None or v is None or v not in self.succs[u]:
+            raise ValueError(f"No connection {server} -> {target}")
+        self.succs[u].remove(v)
+        self.preds[v].remove(u)
+        self._propagate(u)
+
+    def _intern(self, name: str, front: bool) -> int:
+        if name in self.ids:
+            return self.ids[name]
+
+        # New servers have no edges yet, so they can sit at either end of the
+        # order; sources go first to avoid a reorder on their first edge.
+        server = len(self.names)
+        self.ids[name] = server
+        self.names.append(name)
+        self.succs.append([])
+        self.preds.append([])
+        self._bits.append(0)
+        self._ways.append([0] * self._size)
+        if front:
+            self._first_pos -= 1
+            self._pos.append(self._first_pos)
+        else:
+            self._last_pos += 1
+            self._pos.append(self._last_pos)
+        return server
+
+    def _compute(self, server: int) -> list[int]:
+        ways = [0] * self._size
+        bit = self._bits[server]
+        if server == self.target:
+            ways[bit] = 1
+            return ways
+
+        for sev in self.succs[server]:
+            for mask, count in enumerate(self._ways[sev]):
+                if count:
+                    ways[mask | bit] += count
+        return ways
+
+    def _propagate(self, server: int) -> None:
+        pos = self._pos
+        heap = [(-pos[server], server)]
+        queued = {server}
+
+        while heap:
+            _, server = heapq.heappop(heap)
+            queued.discard(server)
+            ways = self._compute(server)
+            if ways == self._ways[server]:
+                continue
+            self._ways[server] = ways
+            for pred in self.preds[server]:
+                if pred not in queued:
+                    queued.add(pred)
+                    heapq.heappush(heap, (-pos[pred], pred))
+
+    def _reorder(self, u: int, v: int) -> None:
+        """Restore a topological order before adding ``u -> v`` (pos[u] > pos[v])."""
+        pos = self._pos
+        upper, lower = pos[u], pos[v]
+
+        forward = self._collect(v, self.succs, lambda s: pos[s] <= upper)
+        if u in forward:
+            raise ValueError(
+                f"Connection {self.names[u]} -> {self.names[v]} would create a cycle"
+            )
+        backward = self._collect(u, self.preds, lambda s: pos[s] >= lower)
+
+        affected = sorted(backward, key=pos.__getitem__) + sorted(
+            forward, key=pos.__getitem__
+        )
+        for server, new_pos in zip(affected, sorted(pos[s] for s in affected)):
+            pos[server] = new_pos
+
+    @staticmethod
+    def _collect(start: int, adjacency: list[list[int]], keep) -> set[int]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            for nxt in adjacency[stack.pop()]:
+                if nxt not in seen and keep(nxt):
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return seen
+
+
+def _log_sum(values: list[float]) -> float:
+    """``log(sum(exp(v) for v in values))`` without leaving float range."""
+    top = max(values, default=-inf)
+    if top == -inf:
+        return -inf
+    return top + log(sum(exp(v - top) for v in values))
@@ -1,4 +1,5 @@
-from Parser import ServerConnectionParser
+from Day11.Parser import InternedServerConnectionParser, ServerGraph
+from Day11.PathCounter import PathCounter
 from common.Utils import main
 
 
@@ -7,18 +8,15 @@ class AllPathFinder:
     TARGET: str = "out"
 
     @classmethod
-    def run(cls, conns: dict[str, tuple[str]]) -> int:
-        return cls._get_all_path_counter(conns, cls.START)
-
-    @classmethod
-    def _get_all_path_counter(cls, conns: dict[str, tuple[str]], server: str) -> int:
-        if server == cls.TARGET:
-            return 1
-
-        return sum(
-            cls._get_all_path_counter(conns, sev) for sev in conns.get(server, tuple())
-        )
+    def run(
+        cls,
+        conns: dict[str, tuple[str]] | ServerGraph,
+        modulus: int | None = None,
+        log_counts: bool = False,
+    ) -> int | float:
+        counter = PathCounter(conns, modulus, log_counts)
+        return counter.count_paths(cls.START, cls.TARGET)
 
 
 if __name__ == "__main__":
-    main(ServerConnectionParser, AllPathFinder, test=False)
+    main(InternedServerConnectionParser, AllPathFinder, test=False)
@@ -1,6 +1,5 @@
-from functools import lru_cache
-
-from Day11.Parser import ServerConnectionParser
+from Day11.Parser import InternedServerConnectionParser, ServerGraph
+from Day11.PathCounter import IncrementalPathCounter, PathCounter
 from common.Utils import main
 
 
@@ -9,27 +8,25 @@ class DACFFTPathFinder:
     DAC: str = "dac"
     FFT: str = "fft"
     TARGET: str = "out"
-    conns: dict[str, tuple[str]]
 
     @classmethod
-    def run(cls, conns: dict[str, tuple[str]]) -> int:
-        cls.CONNS = conns
-        cls._get_all_path_counter.cache_clear()
-        return cls._get_all_path_counter(cls.START, False, False)
+    def run(
+        cls,
+        conns: dict[str, tuple[str]] | ServerGraph,
+        modulus: int | None = None,
+        log_counts: bool = False,
+    ) -> int | float:
+        counter = PathCounter(conns, modulus, log_counts)
+        counts = counter.waypoint_counts(cls.START, cls.TARGET, [cls.DAC, cls.FFT])
+        return counts[0b11]
 
     @classmethod
-    @lru_cache(maxsize=None)
-    def _get_all_path_counter(cls, server: str, dac: bool, fft: bool) -> int:
-        if server == cls.TARGET and dac and fft:
-            return 1
-
-        dac, fft = dac or server == cls.DAC, fft or server == cls.FFT
-
-        return sum(
-            cls._get_all_path_counter(sev, dac, fft)
-            for sev in cls.CONNS.get(server, tuple())
-        )
+    def incremental(
+        cls, conns: dict[str, tuple[str]] | ServerGraph
+    ) -> IncrementalPathCounter:
+        """Counter whose ``count(cls.START)`` tracks ``run`` across edge edits."""
+        return IncrementalPathCounter(conns, cls.TARGET, [cls.DAC, cls.FFT])
 
 
 if __name__ == "__main__":
-    main(ServerConnectionParser, DACFFTPathFinder, test=False)
+    main(InternedServerConnectionParser, DACFFTPathFinder, test=False)
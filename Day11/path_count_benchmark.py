@@ -0,0 +1,34 @@
+import time
+
+from Day11.Parser import ServerGraph
+from Day11.PathCounter import PathCounter
+from benchmarks.generators import layered_dag
+
+
+def _time(counter: PathCounter, target: int) -> float:
+    start = time.perf_counter()
+    counter.paths_to(target)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    modes = {
+        "exact": {},
+        "modulus": {"modulus": 1_000_000_007},
+        "log": {"log_counts": True},
+    }
+
+    print(f"{'layers':>8}{'edges':>10}{'paths':>12}", end="")
+    print("".join(f"{mode + ' edges/s':>18}" for mode in modes))
+
+    for layers in (100, 1000, 5000):
+        graph = ServerGraph.from_connection_map(layered_dag(layers, 200, 3))
+        target = graph.ids["out"]
+        paths = PathCounter(graph).count_paths("svr", "out")
+        magnitude = f"~2^{paths.bit_length() - 1}"
+
+        print(f"{layers:>8}{len(graph.targets):>10}{magnitude:>12}", end="")
+        for kwargs in modes.values():
+            duration = _time(PathCounter(graph, **kwargs), target)
+            print(f"{len(graph.targets) / duration:>18,.0f}", end="")
+        print()
@@ -1,25 +1,97 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
 from itertools import islice
 
 from common.FileReader import CordParser
-from common.Utils import timer
+from common.ParseCache import ParseCache
+from common.Utils import solve_instrumented, timer
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the pure Python paths are used without it
+    np = None
 
 
 @timer
-def main(cls):
+def main(
+    cls, report: str | None = None, profile: bool = False, memory: bool = False
+):
     # input_coords = CordParser().read_file("./test_input.txt")
-    input_coords = CordParser().read_file("./input.txt")
-    print(cls.run(input_coords))
+    solve_instrumented(
+        lambda: ParseCache().read_file(CordParser(), "./input.txt", mapped=True),
+        cls,
+        report,
+        profile,
+        memory,
+    )
+
+
+PACK_SHIFT = 32
+PACK_ROW = 1 << PACK_SHIFT
+_PACK_HALF = 1 << (PACK_SHIFT - 1)
+
+
+def pack_xy(x: int, y: int) -> int:
+    """Pack a coordinate into one int, ``y << 32 | x`` for ``|x| < 2**31``.
+
+    Consecutive x values on a row are consecutive ints and moving one row is
+    ``+ PACK_ROW``, so tile walks can work on plain integers.
+    """
+    return (y << PACK_SHIFT) + x
+
+
+def unpack_xy(packed: int) -> tuple[int, int]:
+    x = ((packed + _PACK_HALF) & (PACK_ROW - 1)) - _PACK_HALF
+    return x, (packed - x) >> PACK_SHIFT
 
 
-@dataclass(frozen=True)
 class Coord:
+    """Immutable grid coordinate.
+
+    Behaves like the frozen dataclass it replaces (field equality, hashing,
+    repr and ``FrozenInstanceError`` on assignment) without a per-instance
+    ``__dict__``.
+    """
+
+    __slots__ = ("x", "y")
+
     x: int
     y: int
 
+    def __init__(self, x: int, y: int) -> None:
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not Coord:
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return hash((self.y << PACK_SHIFT) + self.x)
+
+    def __repr__(self) -> str:
+        return f"Coord(x={self.x!r}, y={self.y!r})"
+
+    def __reduce__(self):
+        return Coord, (self.x, self.y)
+
+    @property
+    def packed(self) -> int:
+        return pack_xy(self.x, self.y)
+
+    @classmethod
+    def from_packed(cls, packed: int) -> Coord:
+        return cls(*unpack_xy(packed))
+
     def get_area(self, other_coord: Coord) -> int:
         return (abs(self.x - other_coord.x) + 1) * (abs(self.y - other_coord.y) + 1)
 
@@ -44,3 +116,34 @@ class Coord:
 
     def distance_to(self, other_coord: Coord) -> int:
         return abs(self.x - other_coord.x) + abs(self.y - other_coord.y)
+
+
+def coords_to_array(input_list: list[list[int]]) -> np.ndarray:
+    """Load ``CordParser`` output into an ``(n, 2)`` int64 array of ``x, y``."""
+    return np.asarray(input_list, dtype=np.int64).reshape(-1, 2)
+
+
+def pair_area_block(
+    points: np.ndarray, start: int, stop: int, col_start: int = 0
+) -> np.ndarray:
+    """Areas between ``points[start:stop]`` and ``points[col_start:]``."""
+    xs = points[:, 0]
+    ys = points[:, 1]
+    widths = np.abs(xs[start:stop, None] - xs[None, col_start:]) + 1
+    heights = np.abs(ys[start:stop, None] - ys[None, col_start:]) + 1
+    return widths * heights
+
+
+def max_pair_area(points: np.ndarray, block_size: int = 64) -> int:
+    n = len(points)
+    max_area = 0
+
+    for start in range(0, n - 1, block_size):
+        stop = min(start + block_size, n - 1)
+        # Columns before start + 1 only hold pairs already seen from the other
+        # side; the few mirrored or diagonal cells left in the block cannot
+        # exceed a real pair's area, so no triangular mask is needed.
+        areas = pair_area_block(points, start, stop, col_start=start + 1)
+        max_area = max(max_area, int(areas.max()))
+
+    return max_area
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from Day9.Utils import Coord, pack_xy
+from Day9.day_9_part_2 import Polygon
+
+
+@dataclass(frozen=True)
+class DataclassCoord:
+    """The previous ``Coord`` representation, kept for comparison only."""
+
+    x: int
+    y: int
+
+
+SIDE = 400
+
+
+def _build(kind: str) -> list:
+    if kind == "dataclass":
+        return [DataclassCoord(x, y) for y in range(SIDE) for x in range(SIDE)]
+    if kind == "slots":
+        return [Coord(x, y) for y in range(SIDE) for x in range(SIDE)]
+    return [pack_xy(x, y) for y in range(SIDE) for x in range(SIDE)]
+
+
+def _memory(kind: str) -> int:
+    tracemalloc.start()
+    tiles = set(_build(kind))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tiles
+    return size
+
+
+def _throughput(kind: str) -> float:
+    """Tiles per second for building a tile set and walking every row through it."""
+    start = time.perf_counter()
+    tiles = set(_build(kind))
+
+    for y in range(SIDE):
+        a, b = Coord(0, y), Coord(SIDE - 1, y)
+        if kind == "dataclass":
+            walk = (DataclassCoord(x, y) for x in range(SIDE))
+        elif kind == "slots":
+            walk = Polygon.iter_edge(a, b)
+        else:
+            walk = Polygon.iter_edge_packed(a, b)
+        for p in walk:
+            if p not in tiles:
+                raise AssertionError(p)
+
+    duration = time.perf_counter() - start
+    return 2 * SIDE * SIDE / duration
+
+
+if __name__ == "__main__":
+    print(f"{'representation':<16}{'set memory':>14}{'tiles/s':>14}")
+    for kind in ("dataclass", "slots", "packed"):
+        memory = _memory(kind)
+        throughput = _throughput(kind)
+        print(f"{kind:<16}{memory / 2**20:>11.1f} MB{throughput:>14,.0f}")
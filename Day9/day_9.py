@@ -1,13 +1,19 @@
-from Utils import Coord, main
+from Day9.Utils import Coord, coords_to_array, main, max_pair_area, np
 
 
 class MaxAreaCoordFinder:
 
     @staticmethod
     def run(input_list: list[list[int]]) -> int:
+        if np is not None:
+            return MaxAreaCoordFinder._get_max_area_vectorized(input_list)
         coords = MaxAreaCoordFinder._parse_coords(input_list)
         return MaxAreaCoordFinder._get_max_area(coords)
 
+    @staticmethod
+    def _get_max_area_vectorized(input_list: list[list[int]]) -> int:
+        return max_pair_area(coords_to_array(input_list))
+
     @staticmethod
     def _parse_coords(input_list: list[list[int]]) -> list[Coord]:
         return [Coord(x, y) for x, y in input_list]
@@ -1,160 +1,227 @@
 from __future__ import annotations
 
+import heapq
 import os
-from bisect import bisect_right
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from collections.abc import Iterable
-from concurrent.futures import ThreadPoolExecutor
-from itertools import pairwise
-from math import ceil, floor
-from threading import Lock
-
-from Utils import Coord, main
-from day_9 import MaxAreaCoordFinder
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from functools import cached_property
+from multiprocessing import Value
+
+from Day9.Utils import (
+    PACK_ROW,
+    Coord,
+    coords_to_array,
+    main,
+    np,
+    pair_area_block,
+)
+from Day9.day_9 import MaxAreaCoordFinder
+from common.Instrumentation import instrumentation
 
 
 class MaxAreaWithinColourFinder(MaxAreaCoordFinder):
+    BATCH_SIZE: int = 2048
+    EXECUTORS: dict[str, type[Executor]] = {
+        "process": ProcessPoolExecutor,
+        "thread": ThreadPoolExecutor,
+    }
 
     @staticmethod
-    def run(input_list: list[list[int]]) -> int:
+    def run(input_list: list[list[int]], executor: str = "process") -> int:
         coords = MaxAreaWithinColourFinder._parse_coords(input_list)
-        polygon = Polygon(coords)
-        return MaxAreaWithinColourFinder._get_max_colour_area(polygon)
+        with instrumentation.span("day9.build_polygon"):
+            polygon = Polygon(coords)
+        return MaxAreaWithinColourFinder._get_max_colour_area(polygon, executor)
 
     @staticmethod
-    def _get_max_colour_area(polygon: Polygon) -> int:
-        rectangles = list(polygon.iter_rectangles_largest_to_smallest())
-        print(f"Checking {len(rectangles)} possible rectangles...")
-        num_threads = min(os.cpu_count(), len(rectangles))
-
-        if num_threads <= 1:
-            print("Running single-threaded...")
-            for i, (c1, c2) in enumerate(rectangles):
-                if i % 1000 == 0:
-                    print(f"Checked {i}/{len(rectangles)} rectangles...")
+    def _get_max_colour_area(
+        polygon: Polygon, executor: str = "process", max_workers: int | None = None
+    ) -> int:
+        if executor not in MaxAreaWithinColourFinder.EXECUTORS:
+            raise ValueError(f"Unknown executor {executor!r}")
+
+        n = len(polygon.edges)
+        total = n * (n - 1) // 2
+        instrumentation.count("day9.candidate_pairs", total)
+        num_workers = min(max_workers or os.cpu_count(), total)
+        rectangles = polygon.iter_rectangles_largest_to_smallest()
+
+        if num_workers <= 1 or not polygon.compressed:
+            checked = 0
+            for c1, c2 in rectangles:
+                checked += 1
                 if polygon.within_area(c1, c2):
-                    area = c1.get_area(c2)
-                    print(f"Found valid rectangle with area {area}")
-                    return area
-            print("No valid rectangles found")
+                    instrumentation.count("day9.rectangles_checked", checked)
+                    return c1.get_area(c2)
+            instrumentation.count("day9.rectangles_checked", checked)
             return 0
 
-        chunks = [rectangles[i::num_threads] for i in range(num_threads)]
+        pool_cls = MaxAreaWithinColourFinder.EXECUTORS[executor]
+        # Shared pruning bound, read and written without a lock. A lost update
+        # only means less pruning; the answer comes from the batch results.
+        bound = Value("q", 0, lock=False)
+        largest_area = 0
+
+        with pool_cls(
+            max_workers=num_workers,
+            initializer=_init_batch_worker,
+            initargs=(polygon.grid, bound),
+        ) as pool:
+            pending = set()
+            batches = MaxAreaWithinColourFinder._iter_batches(
+                rectangles, MaxAreaWithinColourFinder.BATCH_SIZE
+            )
+
+            for batch_max, batch in batches:
+                if batch_max <= largest_area:
+                    break
+                pending.add(pool.submit(_check_batch, batch))
+
+                if len(pending) >= 2 * num_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        area, checked = future.result()
+                        largest_area = max(largest_area, area)
+                        instrumentation.count("day9.rectangles_checked", checked)
+
+            for future in as_completed(pending):
+                area, checked = future.result()
+                largest_area = max(largest_area, area)
+                instrumentation.count("day9.rectangles_checked", checked)
+
+        return largest_area
+
+    @staticmethod
+    def _iter_batches(
+        rectangles: Iterable[tuple[Coord, Coord]], batch_size: int
+    ) -> Iterable[tuple[int, array]]:
+        """Pack candidates into flat ``array('q')`` batches of ``x1, y1, x2, y2, area``.
 
-        largest_area_lock = Lock()
-        largest_area = [0]
-        checked_count = [0]
+        Candidates arrive largest first, so each batch is yielded together with
+        the area of its first (largest) rectangle.
+        """
+        batch = array("q")
+        batch_max = 0
 
-        def check_chunk(thread_id, chunk):
-            local_checked = 0
-            for c1, c2 in chunk:
-                current_area = c1.get_area(c2)
+        for c1, c2 in rectangles:
+            area = c1.get_area(c2)
+            if not batch:
+                batch_max = area
+            batch.extend((c1.x, c1.y, c2.x, c2.y, area))
+            if len(batch) == 5 * batch_size:
+                yield batch_max, batch
+                batch = array("q")
 
-                with largest_area_lock:
-                    if current_area <= largest_area[0]:
-                        print(
-                            f"Thread {thread_id}: Early termination (checked {local_checked} rectangles)"
-                        )
-                        return None
+        if batch:
+            yield batch_max, batch
+
+
+_worker_grid: CompressedGrid | None = None
+_worker_bound = None
+
+
+def _init_batch_worker(grid: CompressedGrid, bound) -> None:
+    global _worker_grid, _worker_bound
+    _worker_grid = grid
+    _worker_bound = bound
 
-                if polygon.within_area(c1, c2):
-                    with largest_area_lock:
-                        if current_area > largest_area[0]:
-                            largest_area[0] = current_area
-                            print(
-                                f"Thread {thread_id}: Found valid rectangle with area {current_area}"
-                            )
-                    return c1, c2
-
-                local_checked += 1
-                if local_checked % 500 == 0:
-                    with largest_area_lock:
-                        checked_count[0] += 500
-                        print(
-                            f"Progress: {checked_count[0]}/{len(rectangles)} rectangles checked, best area so far: {largest_area[0]}"
-                        )
-
-            print(f"Thread {thread_id}: Finished checking {local_checked} rectangles")
-            return None
-
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            futures = [
-                executor.submit(check_chunk, i, chunk) for i, chunk in enumerate(chunks)
-            ]
-
-            largest_found = None
-
-            for future in futures:
-                result = future.result()
-                if result is not None:
-                    c1, c2 = result
-                    area = c1.get_area(c2)
-                    if largest_found is None or area > c1.get_area(largest_found[1]):
-                        largest_found = result
-
-        if largest_found:
-            c1, c2 = largest_found
-            final_area = c1.get_area(c2)
-            print(f"Final result: Maximum area = {final_area}")
-            return final_area
-        print("No valid rectangles found")
-        return 0
+
+def _check_batch(batch: array) -> tuple[int, int]:
+    """Return the area of the first valid rectangle in ``batch`` (or 0) and
+    the number of rectangles checked.
+
+    Batches are sorted largest first, so the first valid rectangle is also the
+    batch's largest. Candidates not larger than the shared bound are skipped.
+    """
+    grid = _worker_grid
+    bound = _worker_bound
+
+    for k in range(0, len(batch), 5):
+        area = batch[k + 4]
+        if area <= bound.value:
+            return 0, k // 5
+        if grid.rectangle_inside_xy(batch[k], batch[k + 1], batch[k + 2], batch[k + 3]):
+            if area > bound.value:
+                bound.value = area
+            return area, k // 5 + 1
+
+    return 0, len(batch) // 5
 
 
 class Polygon:
 
-    def __init__(self, coords: list[Coord]) -> None:
+    def __init__(self, coords: list[Coord], compressed: bool = True) -> None:
         self.edges = coords
+        self.vertices = frozenset(coords)
         xs = [p.x for p in coords]
         ys = [p.y for p in coords]
         self.min_x = min(xs)
         self.max_x = max(xs)
         self.min_y = min(ys)
         self.max_y = max(ys)
+        self.compressed = compressed
 
+        # The row interval index answers containment on demand; the column
+        # index and the compressed grid are only built once something uses them.
         self.scanline_cache = ScanLineCache(coords)
 
-        self.valid_tiles = ValidTilesFinder.get_valid_tiles(coords, self.scanline_cache)
-
-        self.danger_zone = DangerZoneFinder.get_danger_zone(self.valid_tiles)
-        print(
-            f"Valid tiles: {len(self.valid_tiles)}, Danger zone size: {len(self.danger_zone)}"
-        )
+    @cached_property
+    def grid(self) -> CompressedGrid:
+        with instrumentation.span("day9.build_grid"):
+            grid = CompressedGrid(self.edges, self.scanline_cache)
+        instrumentation.count("day9.grid_cells", grid.width * grid.height)
+        return grid
+
+    @cached_property
+    def column_cache(self) -> ScanLineCache:
+        return ScanLineCache([Coord(c.y, c.x) for c in self.edges])
+
+    def contains(self, x: int, y: int) -> bool:
+        """Whether tile ``(x, y)`` is inside the polygon or on its boundary."""
+        return self.scanline_cache.covers(y, x, x)
+
+    def segment_inside(self, a: Coord, b: Coord) -> bool:
+        """Whether every tile of the axis-aligned segment ``a``-``b`` is inside.
+
+        The segment is inside exactly when one merged interval of its row (or
+        column) covers it, i.e. it never crosses the boundary to the outside.
+        """
+        if a.y == b.y:
+            return self.scanline_cache.covers(a.y, min(a.x, b.x), max(a.x, b.x))
+        if a.x == b.x:
+            return self.column_cache.covers(a.x, min(a.y, b.y), max(a.y, b.y))
+        raise ValueError("Segments must be axis-aligned")
 
     def within_area(self, coord1: Coord, coord2: Coord) -> bool:
-        rec_coords = coord1.get_rec_coords(coord2)
-
-        if coord1 not in self.edges or coord2 not in self.edges:
-            return False
-
-        if not self._all_points_valid(coord1, coord2):
+        if coord1 not in self.vertices or coord2 not in self.vertices:
             return False
 
-        return self._edges_in_area(rec_coords)
-
-    def _all_points_valid(self, coord1: Coord, coord2: Coord) -> bool:
-        min_x = min(coord1.x, coord2.x)
-        max_x = max(coord1.x, coord2.x)
-        min_y = min(coord1.y, coord2.y)
-        max_y = max(coord1.y, coord2.y)
-
-        for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                point = Coord(x, y)
-                if point not in self.valid_tiles:
-                    return False
-        return True
-
-    def _edges_in_area(self, rec_coords: tuple[Coord, Coord, Coord, Coord]) -> bool:
-        dz = self.danger_zone
+        if self.compressed:
+            return self.grid.rectangle_inside(coord1, coord2)
 
+        rec_coords = coord1.get_rec_coords(coord2)
         for i in range(4):
-            a = rec_coords[i]
-            b = rec_coords[(i + 1) % 4]
-
-            for p in Polygon.iter_edge(a, b):
-                if p in dz:
-                    return False
-        return True
+            if not self.segment_inside(rec_coords[i], rec_coords[(i + 1) % 4]):
+                return False
+
+        # Inside edges are not enough on their own: tiles on both sides of a
+        # 1-wide slot are inside, so a slot crossing an edge can still lead to
+        # an outside pocket within the rectangle. Every row band must cover it.
+        return self.scanline_cache.covers_rows(
+            min(coord1.y, coord2.y),
+            max(coord1.y, coord2.y),
+            min(coord1.x, coord2.x),
+            max(coord1.x, coord2.x),
+        )
 
     @staticmethod
     def iter_edge(a: Coord, b: Coord):
@@ -173,122 +240,331 @@ class Polygon:
             for y in range(a.y, b.y + step, step):
                 yield Coord(a.x, y)
 
-    def iter_rectangles_largest_to_smallest(
-        self,
-    ) -> Iterable[tuple[Coord, Coord]]:
-        rect_candidates = []
-
-        for i, v1 in enumerate(self.edges):
-            for v2 in self.edges[i + 1 :]:
-                area = v1.get_area(v2)
-                rect_candidates.append((area, v1, v2))
-
-        rect_candidates.sort(reverse=True, key=lambda t: t[0])
-
-        for _, v1, v2 in rect_candidates:
-            yield v1, v2
-
-
-class ValidTilesFinder:
-
     @staticmethod
-    def get_valid_tiles(
-        coords: list[Coord], scanline_cache: ScanLineCache
-    ) -> set[Coord]:
-        valid_tiles = set()
-
-        valid_tiles.update(coords)
-
-        for i in range(len(coords)):
-            v1 = coords[i]
-            v2 = coords[(i + 1) % len(coords)]
-
-            for point in Polygon.iter_edge(v1, v2):
-                valid_tiles.add(point)
-
-        xs = [c.x for c in coords]
-        ys = [c.y for c in coords]
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
-
-        for y in range(min_y, max_y + 1):
-            intervals = scanline_cache._compute_scanline(y)
-            for x1, x2 in intervals:
-                for x in range(x1, x2 + 1):
-                    valid_tiles.add(Coord(x, y))
+    def iter_edge_packed(a: Coord, b: Coord) -> range:
+        """Same walk as ``iter_edge`` but over packed ``pack_xy`` ints."""
+        dx = b.x - a.x
+        dy = b.y - a.y
 
-        return valid_tiles
+        if dx != 0 and dy != 0:
+            raise ValueError("Rectangle edges must be axis-aligned")
 
+        if dx != 0:
+            step = 1 if dx > 0 else -1
+        else:
+            step = PACK_ROW if dy > 0 else -PACK_ROW
+        return range(a.packed, b.packed + step, step)
 
-class DangerZoneFinder:
+    def iter_rectangles_largest_to_smallest(
+        self,
+    ) -> Iterable[tuple[Coord, Coord]]:
+        """Lazily yield vertex pairs ``(v1, v2)`` in descending area order.
+
+        Every vertex ``i`` owns the pairs with partners ``j > i``. A heap keeps
+        one entry per vertex holding its largest remaining pair, so the top of
+        the heap is always the next pair overall. Ties come out in ``(i, j)``
+        order, the same order as a stable sort over all pairs.
+
+        The heap is O(n). A vertex's partners are only sorted once it first
+        reaches the top, and kept as a 4-byte ``array('i')`` order until its
+        last pair is yielded, so a deep search still holds up to O(n^2)
+        entries, just without per-pair Python objects.
+        """
+        edges = self.edges
+        best_partners, best_areas = self._best_partners()
+        heap = [
+            (-area, i, j, -1)
+            for i, (j, area) in enumerate(zip(best_partners, best_areas))
+        ]
+        heapq.heapify(heap)
+
+        partners: dict[int, array] = {}
+
+        while heap:
+            neg_area, i, j, rank = heapq.heappop(heap)
+            yield edges[i], edges[j]
+
+            if rank == -1:
+                # The seed entry is the first partner in sorted order.
+                partners[i] = self._sorted_partners(i)
+                rank = 0
+
+            order = partners[i]
+            rank += 1
+            if rank < len(order):
+                j = order[rank]
+                heapq.heappush(heap, (-edges[i].get_area(edges[j]), i, j, rank))
+            else:
+                del partners[i]
+
+    def _best_partners(self, block_size: int = 64) -> tuple[list[int], list[int]]:
+        """Each vertex's largest-area partner ``j > i`` (first on ties) and area."""
+        n = len(self.edges)
+        if np is None:
+            best_partners, best_areas = [], []
+            for i in range(n - 1):
+                areas = self._partner_areas(i)
+                best = max(range(len(areas)), key=areas.__getitem__)
+                best_partners.append(i + 1 + best)
+                best_areas.append(areas[best])
+            return best_partners, best_areas
+
+        points = self._points
+        best_partners = np.empty(max(n - 1, 0), dtype=np.int64)
+        best_areas = np.empty(max(n - 1, 0), dtype=np.int64)
+        for start in range(0, n - 1, block_size):
+            stop = min(start + block_size, n - 1)
+            block = pair_area_block(points, start, stop, col_start=start + 1)
+            # Row r is vertex start + r, whose partners start at column r.
+            block[np.tril_indices(stop - start, -1, block.shape[1])] = -1
+            best = block.argmax(axis=1)
+            best_partners[start:stop] = best + start + 1
+            best_areas[start:stop] = block[np.arange(stop - start), best]
+
+        return best_partners.tolist(), best_areas.tolist()
+
+    def _partner_areas(self, i: int) -> list[int]:
+        if np is not None:
+            points = self._points
+            return pair_area_block(points, i, i + 1, col_start=i + 1)[0].tolist()
+
+        v1 = self.edges[i]
+        return [v1.get_area(v2) for v2 in self.edges[i + 1 :]]
+
+    def _sorted_partners(self, i: int) -> array:
+        """Partners ``j > i`` sorted by descending area, first ``j`` on ties."""
+        if np is not None:
+            areas = pair_area_block(self._points, i, i + 1, col_start=i + 1)[0]
+            ranked = np.argsort(-areas, kind="stable") + (i + 1)
+            return array("i", ranked.astype(np.int32).tobytes())
+
+        areas = self._partner_areas(i)
+        ranked = sorted(range(len(areas)), key=lambda k: -areas[k])
+        return array("i", [i + 1 + k for k in ranked])
+
+    @cached_property
+    def _points(self) -> np.ndarray:
+        return coords_to_array([(c.x, c.y) for c in self.edges])
+
+
+class CompressedGrid:
+    """Polygon interior on a grid compressed to the distinct vertex x/y values.
+
+    Every vertex coordinate keeps its own column/row and each non-empty gap
+    between two consecutive coordinates collapses into a single cell. A cell
+    is then either completely inside the polygon or completely outside it, so
+    the grid size depends on the vertex count instead of the bounding box.
+    """
+
+    __slots__ = (
+        "col_starts",
+        "row_starts",
+        "_col_idx",
+        "_row_idx",
+        "inside",
+        "_outside_prefix",
+    )
+
+    def __init__(self, coords: list[Coord], scanline_cache: ScanLineCache) -> None:
+        self.col_starts, self._col_idx = CompressedGrid._compress(c.x for c in coords)
+        self.row_starts, self._row_idx = CompressedGrid._compress(c.y for c in coords)
+        self.inside = self._fill(scanline_cache)
+        self._outside_prefix = self._build_outside_prefix()
+
+    @property
+    def width(self) -> int:
+        return len(self.col_starts)
+
+    @property
+    def height(self) -> int:
+        return len(self.row_starts)
 
     @staticmethod
-    def get_danger_zone(valid_tiles: set[Coord]) -> set[Coord]:
-        danger_zone = set()
-        directions = [
-            (dx, dy)
-            for dx in [-1, 0, 1]
-            for dy in [-1, 0, 1]
-            if not (dx == 0 and dy == 0)
-        ]
+    def _compress(values: Iterable[int]) -> tuple[list[int], dict[int, int]]:
+        distinct = sorted(set(values))
+        starts = []
+        index = {}
+
+        for i, value in enumerate(distinct):
+            index[value] = len(starts)
+            starts.append(value)
+            if i + 1 < len(distinct) and distinct[i + 1] - value > 1:
+                starts.append(value + 1)
+
+        return starts, index
+
+    def _fill(self, scanline_cache: ScanLineCache) -> list[bytearray]:
+        # Interval ends are always vertex x values, so they map onto columns.
+        col_idx = self._col_idx
+        inside = [bytearray(self.width) for _ in range(self.height)]
+
+        for row, y in zip(inside, self.row_starts):
+            for x1, x2 in scanline_cache.intervals(y):
+                lo, hi = col_idx[x1], col_idx[x2]
+                row[lo : hi + 1] = b"\x01" * (hi - lo + 1)
+
+        return inside
+
+    def _build_outside_prefix(self) -> array:
+        """Summed-area table of outside cells, flattened row-major.
+
+        Entry ``(r, c)`` at ``r * (width + 1) + c`` holds the number of outside
+        cells in rows ``[0, r)`` and columns ``[0, c)``.
+        """
+        stride = self.width + 1
+        prefix = array("i", bytes(4 * stride * (self.height + 1)))
+
+        for r, row in enumerate(self.inside):
+            above = r * stride
+            cur = above + stride
+            running = 0
+            for c, cell in enumerate(row, start=1):
+                running += cell ^ 1
+                prefix[cur + c] = prefix[above + c] + running
+
+        return prefix
+
+    def rectangle_inside(self, coord1: Coord, coord2: Coord) -> bool:
+        return self.rectangle_inside_xy(coord1.x, coord1.y, coord2.x, coord2.y)
+
+    def rectangle_inside_xy(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        c1, c2 = sorted((self._col_idx[x1], self._col_idx[x2]))
+        r1, r2 = sorted((self._row_idx[y1], self._row_idx[y2]))
+
+        prefix = self._outside_prefix
+        stride = self.width + 1
+        top = r1 * stride
+        bottom = (r2 + 1) * stride
+        outside = (
+            prefix[bottom + c2 + 1]
+            - prefix[top + c2 + 1]
+            - prefix[bottom + c1]
+            + prefix[top + c1]
+        )
+        return outside == 0
 
-        for point in valid_tiles:
-            for dx, dy in directions:
-                neighbor = Coord(point.x + dx, point.y + dy)
-                if neighbor not in valid_tiles:
-                    danger_zone.add(neighbor)
 
-        return danger_zone
+class ScanLineCache:
+    """Inside-or-boundary x intervals for every row of a rectilinear polygon.
 
+    All rows are computed in one sweep over the vertical edges sorted by their
+    y-range. The crossing set only changes at vertex rows, so consecutive rows
+    with identical intervals are stored once as a band starting at
+    ``_band_ys[i]``. ``contains`` is then two bisects with no allocation.
+    """
 
-class ScanLineCache:
-    __slots__ = ("_edges", "_cache", "_lock")
+    __slots__ = ("_band_ys", "_band_starts", "_band_ends")
 
     def __init__(self, polygon: list[Coord]):
-        self._edges: list[tuple[Coord, Coord]] = list(pairwise(polygon))
-        self._cache: dict[int, list[tuple[int, int]]] = {}
-        self._lock = Lock()
+        self._band_ys: list[int] = []
+        self._band_starts: list[list[int]] = []
+        self._band_ends: list[list[int]] = []
+        self._sweep(polygon)
 
     def contains(self, coord: Coord) -> bool:
-        y = coord.y
-        x = coord.x
-
-        intervals = self._cache.get(y)
-        if intervals is None:
-            intervals = self._compute_scanline(y)
-
-        starts = [i[0] for i in intervals]
-        ends = [i[1] for i in intervals]
-
-        idx = bisect_right(starts, x) - 1
-        if idx >= 0 and x <= ends[idx]:
-            return True
-        return False
-
-    def _compute_scanline(self, y: int) -> list[tuple[int, int]]:
-        xs: list[float] = []
-
-        for v1, v2 in self._edges:
-            y1, y2 = v1.y, v2.y
-            if y1 == y2:
-                continue
-            if (y1 <= y <= y2) or (y2 <= y <= y1):
-                x = v1.x + (y - y1) * (v2.x - v1.x) / (y2 - y1)
-                xs.append(x)
-
-        if not xs:
-            intervals = []
-        else:
-            xs.sort()
-            intervals = []
-            it = iter(xs)
-            for x1, x2 in zip(it, it):
-                intervals.append((ceil(x1), floor(x2)))
+        return self.covers(coord.y, coord.x, coord.x)
 
-        with self._lock:
-            self._cache.setdefault(y, intervals)
+    def covers(self, y: int, x1: int, x2: int) -> bool:
+        """Whether one interval of row ``y`` spans all of ``[x1, x2]``."""
+        return self.covers_rows(y, y, x1, x2)
+
+    def covers_rows(self, y1: int, y2: int, x1: int, x2: int) -> bool:
+        """Whether every row in ``[y1, y2]`` has one interval spanning ``[x1, x2]``.
+
+        Only the bands overlapping ``[y1, y2]`` are visited, one bisect each.
+        """
+        band_ys = self._band_ys
+        band = bisect_right(band_ys, y1) - 1
+        if band < 0:
+            return False
 
-        return intervals
+        while True:
+            idx = bisect_right(self._band_starts[band], x1) - 1
+            if idx < 0 or x2 > self._band_ends[band][idx]:
+                return False
+            band += 1
+            if band == len(band_ys) or band_ys[band] > y2:
+                return True
+
+    def intervals(self, y: int) -> list[tuple[int, int]]:
+        band = bisect_right(self._band_ys, y) - 1
+        if band < 0:
+            return []
+        return list(zip(self._band_starts[band], self._band_ends[band]))
+
+    def iter_bands(self) -> Iterable[tuple[int, int, list[tuple[int, int]]]]:
+        """Yield ``(first_y, last_y, intervals)`` for every non-empty band."""
+        for i, y in enumerate(self._band_ys[:-1]):
+            starts = self._band_starts[i]
+            if starts:
+                last_y = self._band_ys[i + 1] - 1
+                yield y, last_y, list(zip(starts, self._band_ends[i]))
+
+    def _sweep(self, polygon: list[Coord]) -> None:
+        vertical_edges: list[tuple[int, int, int]] = []
+        horizontal_edges: dict[int, list[tuple[int, int]]] = {}
+
+        for i in range(len(polygon)):
+            v1 = polygon[i]
+            v2 = polygon[(i + 1) % len(polygon)]
+            if v1.y == v2.y:
+                horizontal_edges.setdefault(v1.y, []).append(
+                    (min(v1.x, v2.x), max(v1.x, v2.x))
+                )
+            elif v1.x == v2.x:
+                vertical_edges.append((min(v1.y, v2.y), max(v1.y, v2.y), v1.x))
+            else:
+                raise ValueError("Polygon edges must be axis-aligned")
+
+        vertical_edges.sort()
+        event_ys = sorted({c.y for c in polygon})
+        # Active edges cover [lo, hi), the half-open rule that keeps every
+        # vertex from being counted twice. Their x values are kept sorted and
+        # a heap of (hi, x) retires each edge at its last row, so an event row
+        # only touches the edges that start or end there.
+        crossings: list[int] = []
+        expiring: list[tuple[int, int]] = []
+        next_edge = 0
+
+        for i, y in enumerate(event_ys):
+            while expiring and expiring[0][0] <= y:
+                _, x = heapq.heappop(expiring)
+                del crossings[bisect_left(crossings, x)]
+            while next_edge < len(vertical_edges) and vertical_edges[next_edge][0] == y:
+                _, hi, x = vertical_edges[next_edge]
+                insort(crossings, x)
+                heapq.heappush(expiring, (hi, x))
+                next_edge += 1
+
+            it = iter(crossings)
+            interior = list(zip(it, it))
+
+            self._add_band(y, interior + horizontal_edges.get(y, []))
+            if i + 1 < len(event_ys) and event_ys[i + 1] > y + 1:
+                self._add_band(y + 1, interior)
+
+        if event_ys:
+            self._add_band(event_ys[-1] + 1, [])
+
+    def _add_band(self, y: int, intervals: list[tuple[int, int]]) -> None:
+        starts: list[int] = []
+        ends: list[int] = []
+
+        for start, end in sorted(intervals):
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        if self._band_starts and (
+            self._band_starts[-1] == starts and self._band_ends[-1] == ends
+        ):
+            return
+
+        self._band_ys.append(y)
+        self._band_starts.append(starts)
+        self._band_ends.append(ends)
 
 
 if __name__ == "__main__":
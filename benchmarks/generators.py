@@ -0,0 +1,136 @@
+"""Seeded synthetic puzzle inputs, written in the same format as ``input.txt``."""
+
+import random
+
+
+def rectilinear_polygon(
+    n_vertices: int, coord_range: int = 100_000, seed: int = 0
+) -> str:
+    """Day 9 input: a simple rectilinear polygon with exactly ``n_vertices`` corners.
+
+    The polygon is a strip of ``n_vertices // 4`` columns, each spanning a
+    random ``[lo, hi]`` band that overlaps its neighbour's, traced along the
+    tops left to right and back along the bottoms. Neighbouring bands never
+    share an edge height, so every corner is a real vertex.
+    """
+    if n_vertices < 4 or n_vertices % 4:
+        raise ValueError(f"n_vertices must be a multiple of 4, got {n_vertices}")
+    columns = n_vertices // 4
+    if coord_range < 2 * columns + 8:
+        raise ValueError(f"coord_range {coord_range} too small for {columns} columns")
+
+    rng = random.Random(seed)
+    xs = sorted(rng.sample(range(coord_range), columns + 1))
+
+    bands = []
+    lo, hi = 0, coord_range
+    for _ in range(columns):
+        while True:
+            new_lo = rng.randrange(coord_range - 1)
+            new_hi = rng.randrange(new_lo + 1, coord_range)
+            # Overlap the previous band, without sharing either edge height.
+            if new_lo < hi and new_hi > lo and new_lo != lo and new_hi != hi:
+                # (0, 1) and (coord_range - 2, coord_range - 1) leave the next
+                # band no such choice, so they are never picked.
+                if new_hi >= 2 and new_lo <= coord_range - 3:
+                    break
+        lo, hi = new_lo, new_hi
+        bands.append((lo, hi))
+
+    points = []
+    for i, (_, hi) in enumerate(bands):
+        points += [(xs[i], hi), (xs[i + 1], hi)]
+    for i in range(columns - 1, -1, -1):
+        lo = bands[i][0]
+        points += [(xs[i + 1], lo), (xs[i], lo)]
+
+    return "".join(f"{x},{y}\n" for x, y in points)
+
+
+def button_systems(
+    count: int,
+    width: int,
+    n_buttons: int,
+    max_presses: int = 10,
+    seed: int = 0,
+) -> str:
+    """Day 10 input: ``count`` machines with ``width`` lights and counters.
+
+    Each line carries an indicator, the buttons and the joltage counters, so
+    it is valid for both ``LightsParser`` and ``CounterParser``. The counters
+    are made from random press counts, so every counter system is solvable;
+    the indicator is any reachable light pattern.
+    """
+    rng = random.Random(seed)
+    lines = []
+
+    for _ in range(count):
+        buttons = [
+            sorted(rng.sample(range(width), rng.randint(1, max(1, width // 2))))
+            for _ in range(n_buttons)
+        ]
+        # Every light needs at least one button, or the counter stays at 0.
+        for light in range(width):
+            if not any(light in button for button in buttons):
+                rng.choice(buttons).append(light)
+        buttons = [sorted(button) for button in buttons]
+
+        presses = [rng.randint(0, max_presses) for _ in buttons]
+        counters = [0] * width
+        lights = 0
+        for button, times in zip(buttons, presses):
+            for light in button:
+                counters[light] += times
+            if rng.random() < 0.5:
+                for light in button:
+                    lights ^= 1 << light
+
+        indicator = "".join("#" if lights >> i & 1 else "." for i in range(width))
+        wiring = " ".join(f"({','.join(map(str, button))})" for button in buttons)
+        lines.append(f"[{indicator}] {wiring} {{{','.join(map(str, counters))}}}\n")
+
+    return "".join(lines)
+
+
+def layered_dag(
+    layers: int, width: int, fan_out: int, seed: int = 0
+) -> dict[str, tuple[str]]:
+    """Connection map of ``layers`` layers of ``width`` servers each.
+
+    Every server connects to ``fan_out`` random servers of the next layer and
+    the last layer connects to ``out``, so ``svr`` reaches ``out`` through
+    roughly ``width * fan_out ** layers`` paths.
+    """
+    rng = random.Random(seed)
+    conns = {"svr": tuple(f"l0n{i}" for i in range(width))}
+
+    for layer in range(layers - 1):
+        for i in range(width):
+            targets = rng.sample(range(width), fan_out)
+            conns[f"l{layer}n{i}"] = tuple(f"l{layer + 1}n{j}" for j in targets)
+    for i in range(width):
+        conns[f"l{layers - 1}n{i}"] = ("out",)
+
+    return conns
+
+
+def server_connections(
+    layers: int, width: int = 50, fan_out: int = 3, seed: int = 0
+) -> str:
+    """Day 11 input: a ``layered_dag`` that both parts can solve.
+
+    ``you`` joins ``svr`` as a start, and one server a third and one two
+    thirds of the way down are renamed to the ``dac`` and ``fft`` waypoints.
+    """
+    if layers < 3:
+        raise ValueError(f"The waypoints need at least 3 layers, got {layers}")
+
+    conns = layered_dag(layers, width, fan_out, seed)
+    conns["you"] = conns["svr"]
+    renames = {f"l{layers // 3}n0": "dac", f"l{2 * layers // 3}n0": "fft"}
+
+    lines = []
+    for server, targets in conns.items():
+        targets = " ".join(renames.get(sev, sev) for sev in targets)
+        lines.append(f"{renames.get(server, server)}: {targets}\n")
+    return "".join(lines)
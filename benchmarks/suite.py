@@ -0,0 +1,222 @@
+"""Size sweeps of every solver entry point on seeded synthetic inputs.
+
+Run from the repository root::
+
+    python -m benchmarks.suite                  # compare against baseline.json
+    python -m benchmarks.suite --save-baseline  # record a new baseline
+    python -m benchmarks.suite --quick          # smallest sizes only
+
+Every size is generated into a temporary file, parsed with the day's parser
+and solved; the solve time is the best of ``--repeat`` runs and peak memory
+is measured with tracemalloc on a separate run, so tracing never inflates the
+timings. tracemalloc only sees the calling process, so process-pool workers
+are not part of the peak. The exit status is 1 when a time or peak exceeds
+its baseline by more than ``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from Day11.Parser import InternedServerConnectionParser
+from benchmarks.generators import (
+    button_systems,
+    rectilinear_polygon,
+    server_connections,
+)
+from common.FileReader import CordParser, ParserStrategy
+from day10.Utils import CounterParser, LightsParser
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+# Differences below these are timer or allocator noise, not regressions.
+NOISE_FLOOR = {"parse_s": 0.005, "solve_s": 0.005, "peak_bytes": 2**20}
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    parser: type[ParserStrategy]
+    solver: str
+    generate: Callable[[int, int], str]
+    sizes: tuple[int, ...]
+
+    def load_solver(self) -> Callable[[Any], Any]:
+        module_name, _, attr = self.solver.rpartition(".")
+        module = __import__(module_name, fromlist=[attr])
+        return getattr(module, attr).run
+
+
+CASES = (
+    Case(
+        "day9.max_area",
+        CordParser,
+        "Day9.day_9.MaxAreaCoordFinder",
+        lambda size, seed: rectilinear_polygon(size, seed=seed),
+        (1000, 4000, 16000),
+    ),
+    Case(
+        "day9.max_area_within_colour",
+        CordParser,
+        "Day9.day_9_part_2.MaxAreaWithinColourFinder",
+        lambda size, seed: rectilinear_polygon(size, seed=seed),
+        (200, 500, 1000),
+    ),
+    Case(
+        "day10.least_button_presses",
+        LightsParser,
+        "day10.day_10.LeastButtonPressFinder",
+        lambda size, seed: button_systems(size, 10, 12, seed=seed),
+        (200, 1000, 5000),
+    ),
+    Case(
+        "day10.least_counter_presses",
+        CounterParser,
+        "day10.day_10_part_2.LeastCounterButtonPressFinder",
+        lambda size, seed: button_systems(size, 8, 10, max_presses=20, seed=seed),
+        (50, 200, 800),
+    ),
+    Case(
+        "day11.all_paths",
+        InternedServerConnectionParser,
+        "Day11.day_11.AllPathFinder",
+        lambda size, seed: server_connections(size, seed=seed),
+        (100, 1000, 5000),
+    ),
+    Case(
+        "day11.dac_fft_paths",
+        InternedServerConnectionParser,
+        "Day11.day_11_part_2.DACFFTPathFinder",
+        lambda size, seed: server_connections(size, seed=seed),
+        (100, 1000, 5000),
+    ),
+)
+
+
+def run_case(case: Case, size: int, seed: int, repeat: int) -> dict[str, float]:
+    solve = case.load_solver()
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(case.generate(size, seed))
+
+        start = time.perf_counter()
+        parsed = case.parser().read_file(path)
+        parse_s = time.perf_counter() - start
+
+        solve_s = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            solve(parsed)
+            solve_s = min(solve_s, time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            solve(case.parser().read_file(path))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        os.unlink(path)
+
+    return {
+        "parse_s": parse_s,
+        "solve_s": solve_s,
+        "throughput": size / (parse_s + solve_s),
+        "peak_bytes": peak,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Descriptions of every time or peak over its baseline by ``tolerance``."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, floor in NOISE_FLOOR.items():
+            if result[metric] - base[metric] <= floor:
+                continue
+            if result[metric] > base[metric] * (1 + tolerance):
+                ratio = result[metric] / base[metric] if base[metric] else float("inf")
+                regressions.append(f"{key} {metric}: {ratio:.2f}x baseline")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument("--quick", action="store_true", help="smallest size only")
+    args.add_argument("--case", action="append", help="run only these cases")
+    args.add_argument("--seed", type=int, default=0)
+    args.add_argument("--repeat", type=int, default=3)
+    args.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    args.add_argument("--save-baseline", action="store_true")
+    args.add_argument("--tolerance", type=float, default=0.5)
+    opts = args.parse_args(argv)
+
+    cases = [case for case in CASES if not opts.case or case.name in opts.case]
+    if opts.case and len(cases) != len(set(opts.case)):
+        known = ", ".join(case.name for case in CASES)
+        raise SystemExit(f"Unknown case in {opts.case}; known cases: {known}")
+
+    baseline = {}
+    if opts.baseline.exists() and not opts.save_baseline:
+        baseline = json.loads(opts.baseline.read_text())["results"]
+
+    header = ("case", "size", "parse s", "solve s", "size/s", "peak MB", "vs base")
+    widths = (30, 8, 10, 10, 14, 10, 9)
+    print("".join(f"{name:>{width}}" for name, width in zip(header, widths)))
+
+    results = {}
+    for case in cases:
+        for size in case.sizes[:1] if opts.quick else case.sizes:
+            key = f"{case.name}:{size}"
+            result = run_case(case, size, opts.seed, opts.repeat)
+            results[key] = result
+
+            base = baseline.get(key)
+            ratio = f"{result['solve_s'] / base['solve_s']:.2f}x" if base else "-"
+            print(
+                f"{case.name:>30}{size:>8}{result['parse_s']:>10.4f}"
+                f"{result['solve_s']:>10.4f}{result['throughput']:>14,.0f}"
+                f"{result['peak_bytes'] / 2**20:>10.1f}{ratio:>9}"
+            )
+
+    if opts.save_baseline:
+        opts.baseline.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "cpus": os.cpu_count(),
+                    "seed": opts.seed,
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"Baseline written to {opts.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, opts.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,93 +1,252 @@
 import csv
 import logging
+import mmap
+import re
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterator
+from operator import itemgetter
 from typing import Any, TextIO
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+Buffer = bytes | mmap.mmap
+
+_NUMBER = re.compile(rb"-?\d+")
+
+
 class ParserStrategy(ABC):
+    # Part of the ParseCache key; bump it when the parsed output changes shape.
+    cache_version: int = 1
+
+    def read_file(self, file_path: str, mapped: bool = False) -> Any:
+        """Parse ``file_path``; ``mapped`` parses a read-only mmap of it instead.
 
-    def read_file(self, file_path: str) -> Any:
+        Both modes return the same results. Parsers that override
+        ``_parse_mapped`` work on the mapped bytes directly; the rest run
+        ``_parse`` over ``iter_mapped_text``, which decodes one line at a time.
+        """
         try:
             file_path = Path(file_path)
+            if mapped:
+                with open(file_path, "rb") as file:
+                    # mmap cannot map an empty file.
+                    if file_path.stat().st_size == 0:
+                        return self._parse_mapped(b"")
+                    buf = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        return self._parse_mapped(buf)
+                    finally:
+                        _close_map(buf)
             with open(file_path, "r") as file:
                 return self._parse(file)
         except FileNotFoundError:
             logger.error(f"File {file_path} not found")
             return []
 
+    def iter_file(self, file_path: str) -> Iterator[Any]:
+        """Yield the records of ``file_path`` lazily, one per ``_iter_parse`` step.
+
+        Only the current line is held in memory, so a solver folding the
+        records one at a time runs in constant memory and overlaps parsing.
+        """
+        try:
+            file_path = Path(file_path)
+            with open(file_path, "r") as file:
+                yield from self._iter_parse(file)
+        except FileNotFoundError:
+            logger.error(f"File {file_path} not found")
+
     @abstractmethod
     def _parse(self, file: TextIO) -> Any:
         pass
 
+    def _iter_parse(self, file: TextIO) -> Iterator[Any]:
+        # Parsers that can emit records per line override this; the default
+        # still works, it just parses everything before the first record.
+        yield from self._parse(file)
+
+    def _parse_mapped(self, buffer: Buffer) -> Any:
+        # Every line-based _parse only iterates over its file.
+        return self._parse(iter_mapped_text(buffer))
+
+
+def _close_map(buffer: mmap.mmap) -> None:
+    try:
+        buffer.close()
+    except BufferError:
+        # A parser that raised may still hold memoryview slices in its
+        # traceback; the map is released with them instead of masking the error.
+        pass
+
+
+def iter_mapped_lines(buffer: Buffer) -> Iterator[memoryview]:
+    """Lines of ``buffer`` as zero-copy memoryview slices, without the newline."""
+    view = memoryview(buffer)
+    start, end = 0, len(buffer)
+    while start < end:
+        stop = buffer.find(b"\n", start)
+        if stop == -1:
+            stop = end
+        yield view[start:stop]
+        start = stop + 1
+
+
+def iter_mapped_text(buffer: Buffer) -> Iterator[str]:
+    """Decoded lines of ``buffer`` as a text-mode file yields them.
+
+    Lines keep their ``"\n"`` (``"\r\n"`` is translated to it) and only one
+    line is decoded at a time.
+    """
+    start, end = 0, len(buffer)
+    while start < end:
+        stop = buffer.find(b"\n", start)
+        line_end = end if stop == -1 else stop
+        line = str(buffer[start:line_end], "utf-8")
+        if line.endswith("\r"):
+            yield line[:-1] + "\n"
+        else:
+            yield line if stop == -1 else line + "\n"
+        start = line_end + 1
+
 
 class LineByLineParser(ParserStrategy):
 
     def _parse(self, file: TextIO) -> list[str]:
         logger.debug("Using LineByLineParser")
-        return [line.strip() for line in file]
+        return list(self._iter_parse(file))
+
+    def _iter_parse(self, file: TextIO) -> Iterator[str]:
+        for line in file:
+            yield line.strip()
+
+    def _parse_mapped(self, buffer: Buffer) -> list[str]:
+        return [str(line, "utf-8").strip() for line in iter_mapped_lines(buffer)]
 
 
 class CSVParser(ParserStrategy):
 
     def _parse(self, file: TextIO) -> list[list[str]]:
         logger.debug("Using CSVParser")
-        return list(csv.reader(file))
+        return list(self._iter_parse(file))
+
+    def _iter_parse(self, file: TextIO) -> Iterator[list[str]]:
+        yield from csv.reader(file)
 
 
 class CommaSeparatedStringParser(ParserStrategy):
 
+    CHUNK_SIZE: int = 1 << 16
+
     def _parse(self, file: TextIO) -> list[str]:
         return file.read().split(",")
 
+    def _iter_parse(self, file: TextIO) -> Iterator[str]:
+        partial = ""
+        while chunk := file.read(self.CHUNK_SIZE):
+            *tokens, partial = (partial + chunk).split(",")
+            yield from tokens
+        yield partial
+
+    def _parse_mapped(self, buffer: Buffer) -> list[str]:
+        tokens = []
+        start = 0
+        while True:
+            stop = buffer.find(b",", start)
+            token = str(buffer[start : len(buffer) if stop == -1 else stop], "utf-8")
+            # Match the newline translation of text mode.
+            tokens.append(token.replace("\r\n", "\n").replace("\r", "\n"))
+            if stop == -1:
+                return tokens
+            start = stop + 1
+
 
 class IntArrayParser(ParserStrategy):
 
     def _parse(self, file: TextIO) -> list[list[int]]:
-        res = []
+        return list(self._iter_parse(file))
+
+    def _iter_parse(self, file: TextIO) -> Iterator[list[int]]:
         for line in file:
-            res.append([int(num) for num in line])
-        return res
+            yield [int(num) for num in line]
 
 
 class StrArrayParser(ParserStrategy):
 
     def _parse(self, file: TextIO) -> list[list[str]]:
-        res = []
+        return list(self._iter_parse(file))
+
+    def _iter_parse(self, file: TextIO) -> Iterator[list[str]]:
         for line in file:
-            res.append(list(line.strip()))
-        return res
+            yield list(line.strip())
+
+    def _parse_mapped(self, buffer: Buffer) -> list[list[str]]:
+        return [list(str(line, "utf-8").strip()) for line in iter_mapped_lines(buffer)]
 
 
 class TwoPartParser(ParserStrategy):
 
     def _parse(self, file: TextIO) -> tuple[list[str], list[str]]:
-        part1 = []
-        part2 = []
-        flag = False
+        parts = ([], [])
+        for part, line in self._iter_parse(file):
+            parts[part].append(line)
+
+        return parts
+
+    def _iter_parse(self, file: TextIO) -> Iterator[tuple[int, str]]:
+        """Yield ``(part, line)``, ``part`` being 0 before the first blank line."""
+        part = 0
         for raw_line in file:
             line = raw_line.strip()
-            if not flag and line == "":
-                flag = True
+            if part == 0 and line == "":
+                part = 1
                 continue
-            if not flag:
-                part1.append(line)
-            else:
-                part2.append(line)
-
-        return part1, part2
+            yield part, line
 
 
 class CordParser(ParserStrategy):
 
     def _parse(self, file: TextIO) -> list[list[int]]:
-        res = []
+        return list(self._iter_parse(file))
 
+    def _iter_parse(self, file: TextIO) -> Iterator[list[int]]:
         for raw_line in file:
             line = raw_line.strip()
-            line_parts = list(map(int, map(str.strip, line.split(","))))
-            res.append(line_parts)
-
-        return res
+            yield list(map(int, map(str.strip, line.split(","))))
+
+    def _parse_mapped(self, buffer: Buffer) -> list[list[int]]:
+        # int() strips whitespace and takes ASCII bytes, so lines go straight
+        # from the map to ints without being decoded.
+        return [
+            [int(num) for num in bytes(line).split(b",")]
+            for line in iter_mapped_lines(buffer)
+        ]
+
+    def read_array(self, file_path: str) -> tuple[array, int]:
+        """Every number of the file in one flat ``array('q')`` and the row width.
+
+        The file is memory mapped and scanned with a single regex pass, so no
+        per-line strings or lists are built. ``numpy.frombuffer(values,
+        dtype=numpy.int64).reshape(-1, width)`` views it as a matrix.
+        """
+        with open(file_path, "rb") as file:
+            if Path(file_path).stat().st_size == 0:
+                return CordParser._parse_array(b"")
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return CordParser._parse_array(buffer)
+            finally:
+                _close_map(buffer)
+
+    @staticmethod
+    def _parse_array(buffer: Buffer) -> tuple[array, int]:
+        # finditer keeps only one match alive at a time, unlike findall.
+        matches = map(itemgetter(0), _NUMBER.finditer(buffer))
+        values = array("q", map(int, matches))
+        first = next((line for line in iter_mapped_lines(buffer) if line.nbytes), b"")
+        width = len(_NUMBER.findall(first))
+        if width and len(values) % width:
+            raise ValueError(f"Rows of {width} numbers expected, got {len(values)}")
+        return values, width
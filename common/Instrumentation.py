@@ -0,0 +1,129 @@
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from typing import Any
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("stats", "name", "start")
+
+    def __init__(self, stats: dict[str, list[float]], name: str) -> None:
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        duration = time.perf_counter() - self.start
+        entry = self.stats.setdefault(self.name, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += duration
+        entry[2] = max(entry[2], duration)
+
+
+class Instrumentation:
+    """Named timing spans and counters, with optional cProfile and tracemalloc.
+
+    Disabled by default: ``span`` then returns a shared no-op context manager
+    and ``count`` returns after one attribute check, so instrumented code can
+    stay in place for normal runs. Hot loops should still tally locally and
+    call ``count`` once per batch. Only the current process is recorded;
+    worker processes have to send their counts back with their results.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.spans: dict[str, list[float]] = {}
+        self.counters: dict[str, int] = {}
+        self._profiler: cProfile.Profile | None = None
+        self._tracing = False
+
+    def enable(self, profile: bool = False, memory: bool = False) -> None:
+        self.enabled = True
+        if profile and self._profiler is None:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+
+    def disable(self) -> None:
+        self.enabled = False
+        if self._profiler is not None:
+            self._profiler.disable()
+
+    def reset(self) -> None:
+        self.disable()
+        self.spans.clear()
+        self.counters.clear()
+        self._profiler = None
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def span(self, name: str) -> _Span | _NullSpan:
+        """Context manager adding the wall time of its block to span ``name``."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self.spans, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def report(self, top: int = 20) -> dict[str, Any]:
+        report: dict[str, Any] = {
+            "spans": {
+                name: {"calls": calls, "total_s": total, "max_s": longest}
+                for name, (calls, total, longest) in self.spans.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            stats = pstats.Stats(self._profiler, stream=io.StringIO())
+            report["profile"] = [
+                {
+                    "function": f"{file}:{line}({func})",
+                    "calls": calls,
+                    "total_s": total,
+                    "cumulative_s": cumulative,
+                }
+                for (file, line, func), (_, calls, total, cumulative, _) in sorted(
+                    stats.stats.items(), key=lambda item: item[1][3], reverse=True
+                )[:top]
+            ]
+            if self.enabled:
+                self._profiler.enable()
+
+        if self._tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            report["memory"] = {"current_bytes": current, "peak_bytes": peak}
+
+        return report
+
+    def write_report(self, file_path: str, top: int = 20) -> None:
+        with open(file_path, "w") as file:
+            json.dump(self.report(top), file, indent=2)
+
+
+instrumentation = Instrumentation()
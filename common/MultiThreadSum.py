@@ -1,13 +1,56 @@
+import functools
+import math
+import numbers
+import operator
 import os
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
 from typing import Callable, Any, Iterable, Union
 
 Number = Union[int, float]
 
 
 class MultiThreadSum:
-    def __init__(self, max_workers=os.cpu_count()) -> None:
+    """Sums ``function(item)`` over a thread pool.
+
+    ``reduction`` picks how results are added up: ``"int"`` keeps an exact
+    Python int and rejects anything but integers (numpy ones included),
+    ``"float"`` is correctly rounded like ``math.fsum`` and ``"mod"`` keeps
+    the total reduced by ``modulus``. The default ``"auto"`` stays exact
+    while results are integers and switches to the ``"float"`` sum at the
+    first one that is not. Items are pulled lazily with at most ``window``
+    (twice the worker count by default) in flight, and results are added as
+    their futures complete, while other items are still running.
+    """
+
+    REDUCTIONS = ("auto", "int", "float", "mod")
+
+    def __init__(
+        self,
+        max_workers=os.cpu_count(),
+        reduction: str = "auto",
+        modulus: int | None = None,
+        window: int | None = None,
+    ) -> None:
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if reduction not in MultiThreadSum.REDUCTIONS:
+            raise ValueError(f"Unknown reduction {reduction!r}")
+        if (reduction == "mod") != (modulus is not None):
+            raise ValueError("modulus is required by, and only used for, 'mod'")
+        if modulus is not None and modulus < 1:
+            raise ValueError(f"modulus must be positive, got {modulus}")
+
         self.max_workers = max_workers
+        self.reduction = reduction
+        self.modulus = modulus
+        self.window = window or 2 * max_workers
 
     def exec(
         self,
@@ -16,18 +59,69 @@ class MultiThreadSum:
         *args: Any,
         **kwargs: Any
     ) -> Number:
-        total: float = 0.0
+        reduction = self.reduction
+        total = 0
+        partials: list[float] = []
+        items = iter(iterable)
+        pending = set()
+
         with ThreadPoolExecutor(max_workers=self.max_workers) as tpe:
-            futures = [tpe.submit(function, item, *args, **kwargs) for item in iterable]
+            while True:
+                for item in islice(items, self.window - len(pending)):
+                    pending.add(tpe.submit(function, item, *args, **kwargs))
+                if not pending:
+                    break
 
-        total += sum(f.result() for f in futures)
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    value = future.result()
+                    if reduction == "auto" and not isinstance(value, numbers.Integral):
+                        reduction = "float"
+                        _add_partial(partials, total)
+                    if reduction == "float":
+                        _add_partial(partials, value)
+                        continue
+                    if not isinstance(value, numbers.Integral):
+                        raise ValueError(
+                            f"{reduction} reduction needs int results, got {value!r}"
+                        )
+                    total += operator.index(value)
+                    if self.modulus:
+                        total %= self.modulus
 
-        return total
+        return math.fsum(partials) if reduction == "float" else total
 
 
-class MultiThreadChunk:
-    def __init__(self, max_workers=os.cpu_count()) -> None:
+def _add_partial(partials: list[float], x: float) -> None:
+    """Add ``x`` to non-overlapping float ``partials`` without rounding error.
+
+    The running form of ``math.fsum`` (Shewchuk's algorithm); ``fsum`` of the
+    partials is the correctly rounded total.
+    """
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+
+class MultiProcessSum:
+    """Sums ``function(item)`` over worker processes, many items per task.
+
+    A process-backed ``MultiThreadChunk`` with ``+`` as the reducer; see there
+    for chunking and the in-flight window. ``function`` must be picklable,
+    i.e. defined at module level.
+    """
+
+    def __init__(self, max_workers=os.cpu_count(), chunk_size: int | None = None):
         self.max_workers = max_workers
+        self.chunk_size = chunk_size
 
     def exec(
         self,
@@ -35,5 +129,123 @@ class MultiThreadChunk:
         iterable: Iterable[Any],
         *args: Any,
         **kwargs: Any
-    ):
-        pass
+    ) -> Number:
+        chunker = MultiThreadChunk(
+            self.max_workers, backend="process", chunk_size=self.chunk_size
+        )
+        return chunker.exec(function, iterable, *args, **kwargs)
+
+
+class MultiThreadChunk:
+    """Chunked, streaming map-reduce of ``function(item)`` over ``iterable``.
+
+    Items are pulled lazily in chunks and at most ``window`` chunks (twice
+    the worker count by default) are in flight, so a huge or lazy iterable is
+    never materialized. Each worker folds its chunk with ``reducer`` and the
+    partial results are folded into ``initial`` as chunks complete, in no
+    particular order: ``reducer`` must be associative and commutative.
+
+    Without a fixed ``chunk_size`` the size adapts so a chunk takes about
+    ``target_seconds`` of worker time, based on the chunks completed so far.
+    ``backend`` is ``"thread"``, ``"process"`` (``function`` and ``reducer``
+    must then be picklable) or ``"inline"``, which runs in the caller.
+    """
+
+    BACKENDS = ("thread", "process", "inline")
+    MAX_CHUNK_SIZE = 4096
+
+    def __init__(
+        self,
+        max_workers=os.cpu_count(),
+        backend: str = "thread",
+        chunk_size: int | None = None,
+        reducer: Callable[[Any, Any], Any] = operator.add,
+        initial: Any = 0,
+        window: int | None = None,
+        target_seconds: float = 0.05,
+    ) -> None:
+        if backend not in MultiThreadChunk.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        self.max_workers = max_workers
+        self.backend = backend
+        self.chunk_size = chunk_size
+        self.reducer = reducer
+        self.initial = initial
+        self.window = window or 2 * max_workers
+        self.target_seconds = target_seconds
+
+    def exec(
+        self,
+        function: Callable[..., Any],
+        iterable: Iterable[Any],
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        if self.backend == "inline":
+            return functools.reduce(
+                self.reducer,
+                (function(item, *args, **kwargs) for item in iterable),
+                self.initial,
+            )
+
+        # Never make chunks so large that some workers are left idle.
+        size = len(iterable) if hasattr(iterable, "__len__") else 0
+        max_chunk = self.MAX_CHUNK_SIZE
+        if size:
+            max_chunk = min(max_chunk, max(1, size // (4 * self.max_workers)))
+        chunk_size = self.chunk_size or 1
+
+        items = iter(iterable)
+        result = self.initial
+        seconds, done_items = 0.0, 0
+        pending = set()
+
+        if self.backend == "thread":
+            executor = ThreadPoolExecutor
+        else:
+            executor = ProcessPoolExecutor
+        with executor(max_workers=self.max_workers) as pool:
+            while True:
+                while len(pending) < self.window:
+                    chunk = list(islice(items, chunk_size))
+                    if not chunk:
+                        break
+                    pending.add(
+                        pool.submit(
+                            _reduce_chunk, function, chunk, args, kwargs, self.reducer
+                        )
+                    )
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    partial, count, elapsed = future.result()
+                    result = self.reducer(result, partial)
+                    done_items += count
+                    seconds += elapsed
+
+                if self.chunk_size is None and seconds > 0:
+                    per_item = seconds / done_items
+                    chunk_size = int(self.target_seconds / per_item)
+                    chunk_size = min(max(chunk_size, 1), max_chunk)
+
+        return result
+
+
+def _reduce_chunk(
+    function: Callable[..., Any],
+    chunk: list[Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    reducer: Callable[[Any, Any], Any],
+) -> tuple[Any, int, float]:
+    start = time.perf_counter()
+    results = (function(item, *args, **kwargs) for item in chunk)
+    partial = functools.reduce(reducer, results)
+    return partial, len(chunk), time.perf_counter() - start
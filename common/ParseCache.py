@@ -0,0 +1,144 @@
+import hashlib
+import logging
+import os
+import pickle
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from common.FileReader import ParserStrategy
+from common.Instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """On-disk cache of parsed inputs, so repeated runs skip parsing.
+
+    An entry is keyed by the SHA-256 of the input file, the parser class, its
+    ``cache_version`` and the source of the module defining it, so editing a
+    parser invalidates its entries. Entries are pickled with protocol 5 and
+    any out-of-band buffers (numpy arrays, ``PickleBuffer``) are stored raw
+    after the pickle. Once the directory grows past ``max_bytes`` the least
+    recently used entries are evicted.
+    """
+
+    FORMAT_VERSION = 1
+    DEFAULT_DIR = Path(__file__).resolve().parent.parent / ".parse_cache"
+    DEFAULT_MAX_BYTES = 256 * 2**20
+    SUFFIX = ".pcache"
+
+    def __init__(
+        self, directory: str | Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = Path(directory) if directory is not None else self.DEFAULT_DIR
+        self.max_bytes = max_bytes
+
+    def read_file(
+        self, parser: ParserStrategy, file_path: str, mapped: bool = False
+    ) -> Any:
+        """``parser.read_file(file_path, mapped)``, from the cache when possible."""
+        try:
+            key = self.key(parser, file_path)
+        except FileNotFoundError:
+            return parser.read_file(file_path, mapped)
+
+        entry = self.directory / f"{key}{self.SUFFIX}"
+        try:
+            result = ParseCache._load(entry)
+            os.utime(entry)
+            instrumentation.count("parse_cache.hits")
+            return result
+        except FileNotFoundError:
+            instrumentation.count("parse_cache.misses")
+        except (pickle.UnpicklingError, EOFError, ValueError, struct.error) as err:
+            logger.warning(f"Discarding unreadable cache entry {entry}: {err}")
+            entry.unlink(missing_ok=True)
+
+        result = parser.read_file(file_path, mapped)
+        self._store(entry, result)
+        return result
+
+    def key(self, parser: ParserStrategy, file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            digest.update(hashlib.file_digest(file, "sha256").digest())
+
+        cls = type(parser)
+        module_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        if module_file is not None:
+            digest.update(Path(module_file).read_bytes())
+        tag = f"{cls.__module__}.{cls.__qualname__}:{parser.cache_version}"
+        digest.update(f"{tag}:{self.FORMAT_VERSION}".encode())
+        return digest.hexdigest()
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return list(self.directory.glob(f"*{self.SUFFIX}"))
+
+    def _store(self, entry: Path, value: Any) -> None:
+        buffers = []
+        try:
+            data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            logger.warning(f"Parsed input cannot be cached: {err}")
+            return
+
+        raws = [buffer.raw() for buffer in buffers]
+        lengths = [raw.nbytes for raw in raws]
+        header = struct.pack(f"<{len(raws) + 2}Q", len(raws), len(data), *lengths)
+        size = len(header) + len(data) + sum(lengths)
+        if size > self.max_bytes:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent runs never read a partial entry.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(header)
+            file.write(data)
+            for raw in raws:
+                file.write(raw)
+        os.replace(tmp, entry)
+        self._evict()
+
+    @staticmethod
+    def _load(entry: Path) -> Any:
+        content = memoryview(entry.read_bytes())
+        n_buffers, n_data = struct.unpack_from("<2Q", content)
+        lengths = struct.unpack_from(f"<{n_buffers}Q", content, 16)
+
+        start = 16 + 8 * n_buffers
+        data = content[start : start + n_data]
+        start += n_data
+        buffers = []
+        for length in lengths:
+            buffers.append(content[start : start + length])
+            start += length
+        if start != len(content):
+            raise ValueError("entry size does not match its header")
+
+        return pickle.loads(data, buffers=buffers)
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
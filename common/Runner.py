@@ -0,0 +1,224 @@
+"""Run any set of puzzle solvers from one command.
+
+    python -m common.Runner                    # every day and part
+    python -m common.Runner 10 11.2 --test     # day 10, day 11 part 2
+    python -m common.Runner 9.1 --input 9=/tmp/big.txt --jobs 1
+
+Solvers are discovered by reading the ``__main__`` block of every
+``DayN/day_N[_part_M].py`` without importing it; each selected solver is then
+imported, parsed and solved in its own worker process, so a run only pays for
+the modules it selects and independent days overlap.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+# Day 9's main only takes the solver class and always reads coordinates.
+DEFAULT_PARSER = "common.FileReader.CordParser"
+
+
+@dataclass(frozen=True)
+class Solver:
+    day: int
+    part: int
+    directory: Path
+    module: str
+    cls: str
+    parser: str
+    options: dict[str, Any] = field(default_factory=dict, hash=False)
+
+    @property
+    def name(self) -> str:
+        return f"{self.day}.{self.part}"
+
+    def selected_by(self, selectors: list[str]) -> bool:
+        return not selectors or any(s in (str(self.day), self.name) for s in selectors)
+
+
+def discover(root: Path = ROOT) -> list[Solver]:
+    solvers = []
+    for directory in root.iterdir():
+        day = re.fullmatch(r"[Dd]ay(\d+)", directory.name)
+        if not day or not directory.is_dir():
+            continue
+        for path in directory.glob("day_*.py"):
+            part = re.fullmatch(rf"day_{day[1]}(?:_part_(\d+))?\.py", path.name)
+            if not part:
+                continue
+            solver = _read_main_call(path, int(day[1]), int(part[1] or 1))
+            if solver is not None:
+                solvers.append(solver)
+
+    return sorted(solvers, key=lambda solver: (solver.day, solver.part))
+
+
+def _read_main_call(path: Path, day: int, part: int) -> Solver | None:
+    """The solver behind the ``main(...)`` call of ``path``'s ``__main__`` block."""
+    tree = ast.parse(path.read_text(), filename=str(path))
+    module = f"{path.parent.name}.{path.stem}"
+
+    imports = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            for alias in node.names:
+                imports[alias.asname or alias.name] = f"{node.module}.{alias.name}"
+
+    for node in tree.body:
+        if not (isinstance(node, ast.If) and "__main__" in ast.unparse(node.test)):
+            continue
+        for call in ast.walk(node):
+            if not (
+                isinstance(call, ast.Call)
+                and isinstance(call.func, ast.Name)
+                and call.func.id == "main"
+            ):
+                continue
+            names = [arg.id for arg in call.args if isinstance(arg, ast.Name)]
+            if not names:
+                continue
+            parser = DEFAULT_PARSER
+            if len(names) > 1:
+                parser = imports.get(names[0], DEFAULT_PARSER)
+            options = {
+                keyword.arg: ast.literal_eval(keyword.value)
+                for keyword in call.keywords
+                if keyword.arg == "stream"
+            }
+            return Solver(day, part, path.parent, module, names[-1], parser, options)
+    return None
+
+
+def _load(qualified_name: str) -> Any:
+    module_name, _, attr = qualified_name.rpartition(".")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def run_solver(solver: Solver, input_path: Path, cache: bool) -> dict[str, Any]:
+    """Import, parse and solve ``solver`` on ``input_path`` and time each step."""
+    from common.ParseCache import ParseCache
+
+    timings: dict[str, Any] = {"import_s": 0.0, "parse_s": 0.0, "solve_s": 0.0}
+    try:
+        start = time.perf_counter()
+        cls = getattr(importlib.import_module(solver.module), solver.cls)
+        parser = _load(solver.parser)()
+        timings["import_s"] = time.perf_counter() - start
+
+        if not input_path.is_file():
+            raise FileNotFoundError(f"Input {input_path} not found")
+
+        start = time.perf_counter()
+        if solver.options.get("stream"):
+            data = parser.iter_file(input_path)
+        elif cache:
+            data = ParseCache().read_file(parser, input_path)
+        else:
+            data = parser.read_file(input_path)
+        timings["parse_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        timings["result"] = str(cls.run(data))
+        timings["solve_s"] = time.perf_counter() - start
+    except Exception as err:
+        timings["result"] = f"error: {type(err).__name__}: {err}"
+
+    return timings
+
+
+def _input_paths(
+    solvers: list[Solver], overrides: list[str], test: bool
+) -> dict[Solver, Path]:
+    by_day = {}
+    for override in overrides:
+        day, sep, path = override.partition("=")
+        if not sep:
+            day, path = "", override
+        by_day[day] = Path(path).resolve()
+
+    paths = {}
+    for solver in solvers:
+        path = by_day.get(solver.name) or by_day.get(str(solver.day)) or by_day.get("")
+        if path is None and test:
+            # Later parts may come with their own example, e.g. test_input2.txt.
+            path = solver.directory / f"test_input{solver.part}.txt"
+            if solver.part == 1 or not path.is_file():
+                path = solver.directory / "test_input.txt"
+        paths[solver] = path or solver.directory / "input.txt"
+    return paths
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument("days", nargs="*", help="days or day.part to run, e.g. 10 11.2")
+    args.add_argument(
+        "-i",
+        "--input",
+        action="append",
+        default=[],
+        help="input file, as DAY=PATH, DAY.PART=PATH or PATH for every solver",
+    )
+    args.add_argument("--test", action="store_true", help="use test_input.txt")
+    args.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    args.add_argument("--no-cache", action="store_true", help="skip the ParseCache")
+    args.add_argument("--list", action="store_true", help="list solvers and exit")
+    opts = args.parse_args(argv)
+
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+    solvers = [solver for solver in discover() if solver.selected_by(opts.days)]
+    if not solvers:
+        print(f"No solvers match {' '.join(opts.days)}", file=sys.stderr)
+        return 1
+    if opts.list:
+        for solver in solvers:
+            print(f"{solver.name:<6}{solver.module}.{solver.cls}")
+        return 0
+
+    paths = _input_paths(solvers, opts.input, opts.test)
+    cache = not opts.no_cache
+
+    start = time.perf_counter()
+    if opts.jobs <= 1 or len(solvers) == 1:
+        results = {
+            solver: run_solver(solver, paths[solver], cache) for solver in solvers
+        }
+    else:
+        with ProcessPoolExecutor(max_workers=min(opts.jobs, len(solvers))) as pool:
+            futures = {
+                pool.submit(run_solver, solver, paths[solver], cache): solver
+                for solver in solvers
+            }
+            results = {futures[f]: f.result() for f in as_completed(futures)}
+    wall = time.perf_counter() - start
+
+    header = ("solver", "class", "result", "import s", "parse s", "solve s")
+    print(f"{header[0]:<8}{header[1]:<32}{header[2]:<24}", end="")
+    print("".join(f"{name:>10}" for name in header[3:]))
+    for solver in solvers:
+        result = results[solver]
+        print(
+            f"{solver.name:<8}{solver.cls:<32}{result['result']:<24}"
+            f"{result['import_s']:>10.4f}{result['parse_s']:>10.4f}"
+            f"{result['solve_s']:>10.4f}"
+        )
+    print(f"Total wall time: {wall:.4f}s")
+
+    failed = any(result["result"].startswith("error:") for result in results.values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,13 @@
+import json
 import pprint
 import time
 from functools import wraps
 from typing import Any
 from typing import Callable, ParamSpec, TypeVar
 
+from common.Instrumentation import instrumentation
+from common.ParseCache import ParseCache
+
 
 def int_list_to_int(int_list: list[int]):
     return int("".join(map(str, int_list)))
@@ -21,18 +25,37 @@ def timer(func: Callable[P, T]) -> Callable[P, T]:
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         start_time = time.perf_counter()
-        result = func(*args, **kwargs)
+        with instrumentation.span(func.__name__):
+            result = func(*args, **kwargs)
         end_time = time.perf_counter()
 
-        duration = end_time - start_time
-        print(f"Function '{func.__name__}' took {duration:.4f}s")
+        # With instrumentation on, the span above already records the time.
+        if not instrumentation.enabled:
+            duration = end_time - start_time
+            print(f"Function '{func.__name__}' took {duration:.4f}s")
         return result
 
     return wrapper
 
 
 @timer
-def main(parser, cls, test=True, custom_file_path: str = None):
+def main(
+    parser,
+    cls,
+    test=True,
+    custom_file_path: str = None,
+    stream=False,
+    cache=True,
+    report: str = None,
+    profile=False,
+    memory=False,
+):
+    """Parse the puzzle input with ``parser`` and print ``cls.run`` of it.
+
+    ``report`` enables instrumentation and writes its JSON report there;
+    ``profile`` and ``memory`` add cProfile and tracemalloc results to it, and
+    without a ``report`` path the report is printed instead.
+    """
     if test:
         file_path = "./test_input.txt"
     else:
@@ -41,5 +64,39 @@ def main(parser, cls, test=True, custom_file_path: str = None):
     if custom_file_path is not None:
         file_path = custom_file_path
 
-    input = parser().read_file(file_path)
-    print(cls.run(input))
+    def load():
+        if stream:
+            return parser().iter_file(file_path)
+        if cache:
+            return ParseCache().read_file(parser(), file_path)
+        return parser().read_file(file_path)
+
+    # Streamed input is parsed lazily while cls.run consumes it, so its
+    # parsing time is part of the solve span.
+    solve_instrumented(load, cls, report, profile, memory)
+
+
+def solve_instrumented(
+    load: Callable[[], Any],
+    cls,
+    report: str = None,
+    profile=False,
+    memory=False,
+):
+    """Print ``cls.run(load())``, timing both calls as ``parse`` and ``solve``.
+
+    Shared by every ``main``; ``report``, ``profile`` and ``memory`` are those
+    of ``main``.
+    """
+    if report is not None or profile or memory:
+        instrumentation.enable(profile=profile, memory=memory)
+
+    with instrumentation.span("parse"):
+        input = load()
+    with instrumentation.span("solve"):
+        print(cls.run(input))
+
+    if report is not None:
+        instrumentation.write_report(report)
+    elif profile or memory:
+        print(json.dumps(instrumentation.report(), indent=2))
@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
 from typing import TextIO
 
 from common.FileReader import ParserStrategy
@@ -38,6 +41,10 @@ class Indicator:
     def __hash__(self) -> int:
         return hash((self._bits, self._max_bit))
 
+    @property
+    def bits(self) -> int:
+        return self._bits
+
     def get_size(self):
         return self._max_bit + 1
 
@@ -64,8 +71,9 @@ class Button:
 class CounterParser(ParserStrategy):
 
     def _parse(self, file: TextIO) -> list[tuple[list[list[int]], list[int]]]:
-        problems = []
+        return list(self._iter_parse(file))
 
+    def _iter_parse(self, file: TextIO) -> Iterator[tuple[list[list[int]], list[int]]]:
         for raw_line in file:
             line = raw_line.strip()
             if not line:
@@ -87,9 +95,7 @@ class CounterParser(ParserStrategy):
 
             T = [int(x) for x in counter]
 
-            problems.append((A, T))
-
-        return problems
+            yield A, T
 
     @staticmethod
     def _parse_line(line: str):
@@ -123,11 +129,11 @@ class CounterParser(ParserStrategy):
 class LightsParser(ParserStrategy):
 
     def _parse(self, file: TextIO) -> list[tuple[Indicator, list[Button]]]:
-        res = []
+        return list(self._iter_parse(file))
+
+    def _iter_parse(self, file: TextIO) -> Iterator[tuple[Indicator, list[Button]]]:
         for raw_line in file:
-            line = raw_line.strip()
-            res.append(self._parse_line(line))
-        return res
+            yield self._parse_line(raw_line.strip())
 
     @staticmethod
     def _parse_line(line: str) -> tuple[Indicator, list[Button]]:
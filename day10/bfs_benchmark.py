@@ -0,0 +1,65 @@
+import random
+import time
+from collections import deque
+
+from day10.Utils import Button, Indicator
+from day10.day_10 import LeastButtonPressFinder
+
+
+def indicator_bfs(target_indicator: Indicator, buttons: list[Button]) -> int:
+    """The previous BFS over ``Indicator`` objects, kept for comparison only."""
+    start_indicator = Indicator(target_indicator.get_size())
+    queue = deque([(start_indicator, 0)])
+    seen = {start_indicator}
+
+    while queue:
+        indicator, press = queue.popleft()
+        if indicator == target_indicator:
+            return press
+
+        for button in buttons:
+            n_indicator = indicator.press_button(button)
+            if n_indicator not in seen:
+                queue.append((n_indicator, press + 1))
+                seen.add(n_indicator)
+
+    return -1
+
+
+def exhaustive_problem(width: int, n_buttons: int, seed: int):
+    """Buttons never touch the last light, which the target needs lit.
+
+    Both searches then visit the whole span of the buttons before giving up,
+    so the number of states explored is exactly ``2 ** rank``.
+    """
+    rng = random.Random(seed)
+    buttons = [
+        Button(rng.sample(range(width - 1), rng.randint(1, 3)), max_bit=width - 1)
+        for _ in range(n_buttons)
+    ]
+    span = {0}
+    for button in buttons:
+        span |= {state ^ button.bits for state in span}
+    return Indicator(width, [width - 1]), buttons, len(span)
+
+
+def _states_per_second(find_presses, indicator, buttons, states) -> float:
+    start = time.perf_counter()
+    try:
+        find_presses(indicator, buttons)
+    except ValueError:
+        pass
+    return states / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    header = ("width", "buttons", "states", "before st/s", "after st/s")
+    print("".join(f"{name:>14}" for name in header))
+    for width in (12, 16, 20):
+        indicator, buttons, states = exhaustive_problem(width, width, seed=width)
+        before = _states_per_second(indicator_bfs, indicator, buttons, states)
+        after = _states_per_second(
+            LeastButtonPressFinder._find_presses, indicator, buttons, states
+        )
+        print(f"{width:>14}{len(buttons):>14}{states:>14}", end="")
+        print(f"{before:>14,.0f}{after:>14,.0f}")
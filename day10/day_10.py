@@ -1,5 +1,6 @@
-from collections import deque
+from collections.abc import Iterable
 
+from common.Instrumentation import instrumentation
 from common.Utils import main
 from day10.Utils import Indicator, Button, LightsParser
 
@@ -7,38 +8,144 @@ from day10.Utils import Indicator, Button, LightsParser
 class LeastButtonPressFinder:
 
     @staticmethod
-    def run(input_toggles: list[tuple[Indicator, list[Button]]]) -> int:
+    def run(
+        input_toggles: Iterable[tuple[Indicator, list[Button]]],
+        method: str = "gf2",
+        validate: bool = False,
+    ) -> int:
+        methods = {
+            "gf2": LeastButtonPressFinder._find_presses_gf2,
+            "bfs": LeastButtonPressFinder._find_presses,
+        }
+        if method not in methods:
+            raise ValueError(f"Unknown method {method!r}")
+        find_presses = methods[method]
+        other = methods["bfs" if method == "gf2" else "gf2"]
+
         presses = 0
 
         for indicator, buttons in input_toggles:
-            presses += LeastButtonPressFinder._find_presses(indicator, buttons)
+            found = find_presses(indicator, buttons)
+            if validate:
+                expected = other(indicator, buttons)
+                if found != expected:
+                    raise ValueError(
+                        f"{method} method found {found} presses, cross-check found "
+                        f"{expected} for indicator {indicator.bits:b}"
+                    )
+            presses += found
 
         return presses
 
+    @staticmethod
+    def _find_presses_gf2(target_indicator: Indicator, buttons: list[Button]) -> int:
+        """Fewest presses by solving ``sum(x_j * button_j) = target`` over GF(2).
+
+        Pressing a button twice cancels out, so a solution is a subset of
+        buttons. Gaussian elimination on the button masks gives one subset and
+        a basis of the null space; the minimum is found by walking the null
+        space in Gray-code order, 2**(buttons - rank) steps instead of 2**buttons.
+        """
+        n = len(buttons)
+        target = target_indicator.bits
+
+        # Row i is light i: bit j set when button j toggles it, bit n is the target.
+        # Buttons may toggle bits past the panel; like the BFS, those must end
+        # up off, so they get rows with a zero target.
+        width = max(
+            [target_indicator.get_size()] + [b.bits.bit_length() for b in buttons]
+        )
+        rows = []
+        for i in range(width):
+            row = (target >> i & 1) << n
+            for j, button in enumerate(buttons):
+                row |= (button.bits >> i & 1) << j
+            rows.append(row)
+
+        pivots = []
+        for col in range(n):
+            rank = len(pivots)
+            sel = next((k for k in range(rank, len(rows)) if rows[k] >> col & 1), None)
+            if sel is None:
+                continue
+            rows[rank], rows[sel] = rows[sel], rows[rank]
+            for k in range(len(rows)):
+                if k != rank and rows[k] >> col & 1:
+                    rows[k] ^= rows[rank]
+            pivots.append(col)
+
+        if any(row >> n & 1 for row in rows[len(pivots) :]):
+            raise ValueError("Indicator cannot be reached with the given buttons")
+
+        solution = 0
+        for k, col in enumerate(pivots):
+            solution |= (rows[k] >> n & 1) << col
+
+        null_basis = []
+        for free in sorted(set(range(n)) - set(pivots)):
+            vector = 1 << free
+            for k, col in enumerate(pivots):
+                vector |= (rows[k] >> free & 1) << col
+            null_basis.append(vector)
+
+        least = solution.bit_count()
+        for step in range(1, 1 << len(null_basis)):
+            solution ^= null_basis[(step & -step).bit_length() - 1]
+            least = min(least, solution.bit_count())
+
+        return least
+
+    DENSE_VISITED_MAX_WIDTH: int = 24
+
     @staticmethod
     def _find_presses(target_indicator: Indicator, buttons: list[Button]) -> int:
-        press = 0
-        if target_indicator.all_false():
-            return press
+        """Fewest presses by breadth-first search over raw int states.
 
-        target_size = target_indicator.get_size()
-        start_indicator = Indicator(target_size)
-        queue = deque([(start_indicator, 0)])
-        seen = {start_indicator}
+        ``Indicator`` is only read at the boundary. States are plain bitmasks,
+        explored one press-level at a time, and visited states live in a dense
+        ``bytearray`` when the panel is narrow enough.
+        """
+        target = target_indicator.bits
+        if target == 0:
+            return 0
 
-        while queue:
-            indicator, press = queue.popleft()
-            if indicator == target_indicator:
-                break
+        width = target_indicator.get_size()
+        masks = list({button.bits for button in buttons} - {0})
+        dense = width <= LeastButtonPressFinder.DENSE_VISITED_MAX_WIDTH
+        if dense and all(mask >> width == 0 for mask in masks):
+            seen = bytearray(1 << width)
+            seen[0] = 1
+        else:
+            seen = None
+            seen_set = {0}
 
-            for button in buttons:
-                n_indicator = indicator.press_button(button)
-                if n_indicator not in seen:
-                    queue.append((n_indicator, press + 1))
-                    seen.add(n_indicator)
+        frontier = [0]
+        press = 0
+        states = 1
+        while frontier:
+            press += 1
+            next_frontier = []
+            for state in frontier:
+                for mask in masks:
+                    n_state = state ^ mask
+                    if n_state == target:
+                        instrumentation.count("day10.bfs_states", states)
+                        return press
+                    if seen is not None:
+                        if seen[n_state]:
+                            continue
+                        seen[n_state] = 1
+                    elif n_state in seen_set:
+                        continue
+                    else:
+                        seen_set.add(n_state)
+                    next_frontier.append(n_state)
+            frontier = next_frontier
+            states += len(frontier)
 
-        return press
+        instrumentation.count("day10.bfs_states", states)
+        raise ValueError("Indicator cannot be reached with the given buttons")
 
 
 if __name__ == "__main__":
-    main(LightsParser, LeastButtonPressFinder, test=False)
+    main(LightsParser, LeastButtonPressFinder, test=False, stream=True)
@@ -1,6 +1,7 @@
-from linopy import Model
+from fractions import Fraction
+from math import lcm
 
-from common.MultiThreadSum import MultiThreadSum
+from common.MultiThreadSum import MultiProcessSum
 from common.Utils import main
 from day10.Utils import CounterParser
 
@@ -8,21 +9,208 @@ from day10.Utils import CounterParser
 class LeastCounterButtonPressFinder:
 
     @staticmethod
-    def run(input: list[tuple[list[list[int]], list[int]]]) -> int:
-        tpe = MultiThreadSum()
+    def run(
+        input: list[tuple[list[list[int]], list[int]]],
+        backend: str = "exact",
+        validate: bool = False,
+    ) -> int:
+        if backend not in ("exact", "highs"):
+            raise ValueError(f"Unknown backend {backend!r}")
 
-        return tpe.exec(LeastCounterButtonPressFinder._find_presses_wrapper, input)
+        ppe = MultiProcessSum()
+
+        find_presses = LeastCounterButtonPressFinder._find_presses_wrapper
+        return ppe.exec(find_presses, input, backend, validate)
 
     @staticmethod
-    def _find_presses_wrapper(input: tuple[list[list[int]], list[int]]) -> int:
+    def _find_presses_wrapper(
+        input: tuple[list[list[int]], list[int]],
+        backend: str = "exact",
+        validate: bool = False,
+    ) -> int:
         A, T = input
-        solver = Solver(A, T)
-        return solver.solve()
+        solver = ExactSolver(A, T) if backend == "exact" else Solver(A, T)
+        presses = solver.solve()
+
+        if validate:
+            other = Solver(A, T) if backend == "exact" else ExactSolver(A, T)
+            expected = other.solve()
+            if presses != expected:
+                raise ValueError(
+                    f"{backend} backend found {presses} presses, cross-check found "
+                    f"{expected} for T={T}"
+                )
+
+        return presses
+
+
+class ExactSolver:
+    """In-process solver for ``A x = T``, ``x >= 0`` integer, minimising ``sum(x)``.
+
+    ``A`` is a small 0/1 matrix, so Gaussian elimination over the rationals
+    leaves only a handful of free variables. Every pivot variable is an affine
+    function of those, and each variable is bounded by the smallest target of
+    a counter it increments. The free variables are searched depth first with
+    a bound on the objective; the last one is solved as an interval instead of
+    being enumerated.
+    """
+
+    def __init__(self, A: list[list[int]], T: list[int]):
+        self.A = A
+        self.T = T
+        self.m = len(self.A)
+        self.n = len(self.A[0]) if self.m > 0 else 0
+
+    def solve(self) -> int:
+        rows, pivots = self._reduce()
+        free = [j for j in range(self.n) if j not in set(pivots)]
+        upper = [
+            min((self.T[i] for i in range(self.m) if self.A[i][j]), default=0)
+            for j in range(self.n)
+        ]
+
+        # Integer form of each pivot row: d * x_p = c - sum(a[f] * x_f).
+        system = []
+        for row, p in zip(rows, pivots):
+            d = lcm(*(value.denominator for value in row))
+            a = [int(row[f] * d) for f in free]
+            system.append((d, int(row[self.n] * d), a, upper[p]))
+
+        # Objective scaled by D: sum(x) * D = base + sum(weight[f] * x_f).
+        D = lcm(*(d for d, _, _, _ in system)) if system else 1
+        base = sum(c * (D // d) for d, c, _, _ in system)
+        weights = [D] * len(free)
+        for d, _, a, _ in system:
+            for k, a_k in enumerate(a):
+                weights[k] -= a_k * (D // d)
+
+        best = self._search(system, [upper[f] for f in free], weights, base)
+        if best is None:
+            raise ValueError(f"No non-negative integer solution for T={self.T}")
+        return best // D
+
+    def _reduce(self) -> tuple[list[list[Fraction]], list[int]]:
+        """Reduced row echelon form of ``[A | T]`` and its pivot columns."""
+        rows = [
+            [Fraction(value) for value in self.A[i]] + [Fraction(self.T[i])]
+            for i in range(self.m)
+        ]
+        pivots = []
+
+        for col in range(self.n):
+            rank = len(pivots)
+            sel = next((k for k in range(rank, self.m) if rows[k][col] != 0), None)
+            if sel is None:
+                continue
+            rows[rank], rows[sel] = rows[sel], rows[rank]
+            pivot = rows[rank][col]
+            rows[rank] = [value / pivot for value in rows[rank]]
+            for k in range(self.m):
+                factor = rows[k][col]
+                if k != rank and factor != 0:
+                    rows[k] = [v - factor * p for v, p in zip(rows[k], rows[rank])]
+            pivots.append(col)
+
+        if any(row[self.n] != 0 for row in rows[len(pivots) :]):
+            raise ValueError(f"Inconsistent counter system for T={self.T}")
+
+        return rows[: len(pivots)], pivots
+
+    @staticmethod
+    def _search(
+        system: list[tuple[int, int, list[int], int]],
+        upper: list[int],
+        weights: list[int],
+        base: int,
+    ) -> int | None:
+        n_free = len(upper)
+        best = None
+        # rest[k] is the most the free variables k.. can still lower the objective.
+        rest = [0] * (n_free + 1)
+        for k in range(n_free - 1, -1, -1):
+            rest[k] = rest[k + 1] + min(0, weights[k] * upper[k])
+
+        def pivot_values(values: list[int]) -> bool:
+            for d, c, a, ub in system:
+                num = c - sum(a_k * v for a_k, v in zip(a, values))
+                if num < 0 or num % d or num // d > ub:
+                    return False
+            return True
+
+        def feasible_so_far(values: list[int]) -> bool:
+            k = len(values)
+            for d, c, a, ub in system:
+                num = c - sum(a_k * v for a_k, v in zip(a, values))
+                # Best case over the unassigned variables for 0 <= x_p <= ub.
+                low = num - sum(max(0, a[j] * upper[j]) for j in range(k, n_free))
+                high = num - sum(min(0, a[j] * upper[j]) for j in range(k, n_free))
+                if high < 0 or low > d * ub:
+                    return False
+            return True
+
+        def last_range(values: list[int]) -> range | None:
+            k = n_free - 1
+            lo, hi = 0, upper[k]
+            for d, c, a, ub in system:
+                num = c - sum(a_j * v for a_j, v in zip(a, values))
+                # Need 0 <= num - a[k] * x <= d * ub.
+                if a[k] > 0:
+                    hi = min(hi, num // a[k])
+                    lo = max(lo, -((d * ub - num) // a[k]))
+                elif a[k] < 0:
+                    lo = max(lo, -(num // -a[k]))
+                    hi = min(hi, (d * ub - num) // -a[k])
+                elif not 0 <= num <= d * ub:
+                    return None
+            if lo > hi:
+                return None
+            return range(hi, lo - 1, -1) if weights[k] < 0 else range(lo, hi + 1)
+
+        def visit(values: list[int], objective: int) -> None:
+            nonlocal best
+            k = len(values)
+            if best is not None and objective + rest[k] >= best:
+                return
+
+            if k == n_free:
+                if pivot_values(values):
+                    best = objective
+                return
+
+            if k == n_free - 1:
+                candidates = last_range(values)
+                if candidates is None:
+                    return
+                # The objective is monotone along the range, so the first
+                # integral point is the best of this branch.
+                for x in candidates:
+                    if pivot_values(values + [x]):
+                        total = objective + weights[k] * x
+                        if best is None or total < best:
+                            best = total
+                        return
+                return
+
+            if weights[k] < 0:
+                order = range(upper[k], -1, -1)
+            else:
+                order = range(upper[k] + 1)
+            for x in order:
+                values.append(x)
+                if feasible_so_far(values):
+                    visit(values, objective + weights[k] * x)
+                values.pop()
+
+        visit([], base)
+        return best
 
 
 class Solver:
+    """HiGHS backend through linopy, kept for cross-checking ``ExactSolver``."""
 
     def __init__(self, A, T):
+        from linopy import Model
+
         self.A = A
         self.T = T
         self.m = len(self.A)
@@ -42,9 +230,8 @@ class Solver:
         self.model.add_objective(x.sum())
         self.model.solve(solver_name="highs", quiet=True)
 
-        return int(
-            self.model.objective.value,
-        )
+        # The MIP objective comes back as a float such as 105.99999999999999.
+        return round(self.model.objective.value)
 
 
 if __name__ == "__main__":